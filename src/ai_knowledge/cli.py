@@ -1,34 +1,77 @@
 """CLI interface for agent-dev-tool."""
 
-import json
 import os
+import re
+import sys
 from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
-from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.tree import Tree
-
-from .indexer import build_full_index
-from .models import GlobalConfig, KnowledgeNode, NodeType, ProjectConfig
-from .store import (
-    get_config_path,
-    get_index_path,
-    load_config,
-    load_index,
-    save_config,
-    save_index,
-)
+
+# Rich-formatted help only pays off on a terminal; piped or scripted --help
+# falls back to click's plain formatter and never imports rich/pygments.
+_HELP_MARKUP = "rich" if sys.stdout.isatty() else None
 
 app = typer.Typer(
     name="adt",
     help="Agent Dev Tool - Hierarchical knowledge management for AI-assisted development",
     no_args_is_help=True,
+    rich_markup_mode=_HELP_MARKUP,
 )
-console = Console()
+
+# Rich and the knowledge modules are imported inside the commands that use
+# them so that `adt --help` and argument errors don't pay for loading them.
+_console_instance = None
+
+
+def _console():
+    """Get the shared Rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
+        _console_instance = Console()
+    return _console_instance
+
+
+# Rich's markup tag syntax (rich.markup.RE_TAGS), for stripping tags without Rich
+_MARKUP_TAG_RE = re.compile(r"(\\*)\[([a-z#/@][^[]*?)]")
+
+
+def _strip_markup(text: str) -> str:
+    """Remove Rich markup tags from text, keeping escaped ones as literal brackets."""
+    def replace(match: re.Match) -> str:
+        backslashes, escaped = divmod(len(match.group(1)), 2)
+        return "\\" * backslashes + (f"[{match.group(2)}]" if escaped else "")
+    
+    return _MARKUP_TAG_RE.sub(replace, text)
+
+
+def rprint(*objects, file=None, **kwargs) -> None:
+    """Print with Rich markup through the shared console.
+    
+    Rich is imported only when something is printed; output to another
+    stream (e.g. file=sys.stderr) goes through rich.print instead. Plain
+    strings headed for a pipe or file are printed with the markup stripped,
+    without loading Rich at all.
+    """
+    stream = sys.stdout if file is None else file
+    if (
+        not kwargs
+        and _console_instance is None
+        and all(isinstance(o, str) for o in objects)
+        and not stream.isatty()
+    ):
+        print(_strip_markup(" ".join(objects)), file=stream)
+        return
+    if file is not None:
+        from rich import print as rich_print
+        rich_print(*objects, file=file, **kwargs)
+    else:
+        _console().print(*objects, **kwargs)
+
+
+# Placeholder names that an LLM-suggested project name should replace
+_GENERIC_NAMES = frozenset({"myapi", "myapp", "myproject", "app", "api", "project", "test", "demo"})
 
 
 @app.command()
@@ -43,6 +86,7 @@ def init(
     deployment: Annotated[Optional[str], typer.Option("--deploy", help="Override: docker, render, vercel")] = None,
     yes: Annotated[bool, typer.Option("--yes", "-y", help="Skip confirmation")] = False,
     no_register: Annotated[bool, typer.Option("--no-register", help="Don't register with adt")] = False,
+    refresh_env: Annotated[bool, typer.Option("--refresh-env", help="Re-check local LLM availability instead of using the cached result")] = False,
 ):
     """Initialize a new project or global .ai directory.
     
@@ -54,6 +98,10 @@ def init(
         adt init myapi --desc "REST API for invoices"
         adt init myapp --type=fullstack --backend=fastapi
     """
+    from rich.panel import Panel
+    from .models import ProjectConfig
+    from .store import load_config, save_config
+    
     # Global init if no name provided
     if not name:
         _init_global()
@@ -66,7 +114,7 @@ def init(
     # Get project configuration
     if description:
         rprint(f"[bold]Analyzing project description...[/bold]")
-        if is_ollama_available():
+        if is_ollama_available(refresh=refresh_env):
             rprint("  Using local LLM (Ollama)")
         else:
             rprint("  Using heuristics (Ollama not available)")
@@ -85,13 +133,13 @@ def init(
     
     # Check if LLM suggested a better name
     suggested_name = inferred.get("suggested_name")
-    generic_names = {"myapi", "myapp", "myproject", "app", "api", "project", "test", "demo"}
+    name_lc = name.lower()
     
-    if suggested_name and name.lower() in generic_names:
+    if suggested_name and name_lc in _GENERIC_NAMES:
         # LLM found a name in description and user gave generic name
         project_name = suggested_name
         rprint(f"  [cyan]Suggested name:[/cyan] {suggested_name} (from description)")
-    elif suggested_name and name.lower() != suggested_name.lower():
+    elif suggested_name and name_lc != suggested_name.lower():
         # LLM found a different name - will ask user
         project_name = name  # Use provided name for now, ask later
     else:
@@ -165,8 +213,8 @@ def init(
         register=not no_register,
     )
     
-    for f in result["created_files"]:
-        rprint(f"  [green]✓[/green] {f}")
+    if result["created_files"]:
+        rprint("\n".join(f"  [green]✓[/green] {f}" for f in result["created_files"]))
     
     # Register with adt
     if not no_register:
@@ -184,41 +232,40 @@ def init(
     # Initialize git
     import subprocess
     try:
-        subprocess.run(["git", "init"], cwd=project_path, capture_output=True, check=True)
+        subprocess.run(
+            ["git", "init", "-q"],
+            cwd=project_path,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
         rprint(f"  [green]✓[/green] Initialized git repository")
     except (subprocess.CalledProcessError, FileNotFoundError):
         pass
     
-    rprint("")
-    rprint(f"[green]✓ Project created at {project_path}[/green]")
-    rprint("")
-    rprint("[bold]Next steps:[/bold]")
-    rprint(f"  cd {project_path}")
+    # Render the summary in one print rather than one console call per line
+    lines = [
+        "",
+        f"[green]✓ Project created at {project_path}[/green]",
+        "",
+        "[bold]Next steps:[/bold]",
+        f"  cd {project_path}",
+    ]
     
     if inferred["stack"].get("backend") in ("fastapi", "django"):
-        rprint("  uv sync")
-        rprint("  make dev")
+        lines += ["  uv sync", "  make dev"]
     elif inferred["stack"].get("backend") == "express":
-        rprint("  pnpm install")
-        rprint("  pnpm dev")
+        lines += ["  pnpm install", "  pnpm dev"]
     elif inferred["stack"].get("frontend") != "none":
         if inferred["type"] == "fullstack":
-            rprint("  uv sync && cd frontend && pnpm install")
+            lines.append("  uv sync && cd frontend && pnpm install")
         else:
-            rprint("  pnpm install")
-            rprint("  pnpm dev")
+            lines += ["  pnpm install", "  pnpm dev"]
+    
+    rprint("\n".join(lines))
 
 
-def _init_global():
-    """Initialize global .ai directory."""
-    config = load_config()
-    
-    global_ai_dir = config.global_ai_dir
-    global_ai_dir.mkdir(parents=True, exist_ok=True)
-    
-    rules_file = global_ai_dir / "rules.md"
-    if not rules_file.exists():
-        rules_file.write_text("""# Global AI Rules
+_GLOBAL_RULES_TEMPLATE = """# Global AI Rules
 
 > Universal rules for all projects. AI assistants should follow these unless project-specific rules override them.
 
@@ -260,11 +307,9 @@ adt tool list                       # List available tools
 
 When corrected, ask: "Should I add this to learnings?"
 Then run: `adt learn "Title" -i "issue" -c "correction"`
-""")
-    
-    learnings_file = global_ai_dir / "learnings.md"
-    if not learnings_file.exists():
-        learnings_file.write_text("""# Global Learnings
+"""
+
+_GLOBAL_LEARNINGS_TEMPLATE = """# Global Learnings
 
 > Universal corrections that apply across all projects.
 
@@ -273,7 +318,22 @@ Then run: `adt learn "Title" -i "issue" -c "correction"`
 ---
 
 *No entries yet.*
-""")
+"""
+
+
+def _init_global():
+    """Initialize global .ai directory."""
+    from .store import get_config_path, load_config, save_config
+    
+    config = load_config()
+    
+    global_ai_dir = config.global_ai_dir
+    global_ai_dir.mkdir(parents=True, exist_ok=True)
+    
+    _write_templates([
+        (global_ai_dir / "rules.md", _GLOBAL_RULES_TEMPLATE),
+        (global_ai_dir / "learnings.md", _GLOBAL_LEARNINGS_TEMPLATE),
+    ])
     
     # Create skills and tools directories
     (global_ai_dir / "skills").mkdir(exist_ok=True)
@@ -285,37 +345,25 @@ Then run: `adt learn "Title" -i "issue" -c "correction"`
     rprint(f"[green]✓[/green] Configuration saved to {get_config_path()}")
 
 
-@app.command()
-def add(
-    path: Annotated[Path, typer.Argument(help="Path to the project directory")],
-    name: Annotated[Optional[str], typer.Option("--name", "-n", help="Project name")] = None,
-    description: Annotated[Optional[str], typer.Option("--desc", "-d", help="Project description")] = None,
-    tags: Annotated[Optional[str], typer.Option("--tags", "-t", help="Comma-separated tags")] = None,
-):
-    """Register a project with the knowledge system."""
-    path = path.expanduser().resolve()
-    
-    if not path.exists():
-        rprint(f"[red]Error:[/red] Path does not exist: {path}")
-        raise typer.Exit(1)
-    
-    project_name = name or path.name
-    tag_list = [t.strip() for t in tags.split(",")] if tags else []
-    
-    config = load_config()
-    
-    project = ProjectConfig(
-        name=project_name,
-        path=path,
-        description=description,
-        tags=tag_list,
-    )
+def _write_templates(files: list[tuple[Path, str]]) -> list[Path]:
+    """Write template files that don't exist yet and return the paths written.
     
-    ai_dir = project.full_ai_path
-    if not ai_dir.exists():
-        ai_dir.mkdir(parents=True)
-        
-        (ai_dir / "rules.md").write_text(f"""# {project_name} Rules
+    O_CREAT | O_EXCL makes the existence check part of the open, so each
+    file costs one open/write/close and existing files are never touched.
+    """
+    written = []
+    for path, text in files:
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            continue
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        written.append(path)
+    return written
+
+
+_PROJECT_RULES_TEMPLATE = """# {name} Rules
 
 > Project-specific rules and patterns for AI assistants.
 
@@ -331,18 +379,18 @@ def add(
 
 - Check `plan/decisions.md` for architectural context
 - Check `.ai/learnings.md` for past corrections
-""")
-        
-        (ai_dir / "learnings.md").write_text(f"""# {project_name} Learnings
+"""
+
+_PROJECT_LEARNINGS_TEMPLATE = """# {name} Learnings
 
 > Project-specific corrections and lessons learned.
 
 ---
 
 *No entries yet.*
-""")
-        
-        (ai_dir / "context.md").write_text(f"""# {project_name} Context
+"""
+
+_PROJECT_CONTEXT_TEMPLATE = """# {name} Context
 
 > Quick reference for AI assistants.
 
@@ -357,7 +405,51 @@ def add(
 ## Common Tasks
 
 <!-- How to perform common operations -->
-""")
+"""
+
+
+@app.command()
+def add(
+    path: Annotated[Path, typer.Argument(help="Path to the project directory")],
+    name: Annotated[Optional[str], typer.Option("--name", "-n", help="Project name")] = None,
+    description: Annotated[Optional[str], typer.Option("--desc", "-d", help="Project description")] = None,
+    tags: Annotated[Optional[str], typer.Option("--tags", "-t", help="Comma-separated tags")] = None,
+):
+    """Register a project with the knowledge system."""
+    from .models import ProjectConfig
+    from .store import load_config, save_config
+    
+    path = path.expanduser().resolve()
+    
+    if not path.exists():
+        rprint(f"[red]Error:[/red] Path does not exist: {path}")
+        raise typer.Exit(1)
+    
+    project_name = name or path.name
+    tag_list = [t.strip() for t in tags.split(",")] if tags else []
+    
+    config = load_config()
+    
+    project = ProjectConfig(
+        name=project_name,
+        path=path,
+        description=description,
+        tags=tag_list,
+    )
+    
+    ai_dir = project.full_ai_path
+    try:
+        ai_dir.mkdir(parents=True)
+        created = True
+    except FileExistsError:
+        created = False  # an existing .ai/ is left untouched
+    
+    if created:
+        _write_templates([
+            (ai_dir / "rules.md", _PROJECT_RULES_TEMPLATE.format(name=project_name)),
+            (ai_dir / "learnings.md", _PROJECT_LEARNINGS_TEMPLATE.format(name=project_name)),
+            (ai_dir / "context.md", _PROJECT_CONTEXT_TEMPLATE.format(name=project_name)),
+        ])
         
         rprint(f"[green]✓[/green] Created .ai/ directory with templates")
     
@@ -377,6 +469,8 @@ def remove(
     name: Annotated[str, typer.Argument(help="Project name to remove")],
 ):
     """Remove a project from the knowledge system."""
+    from .store import load_config, save_config
+    
     config = load_config()
     project = config.get_project(name)
     
@@ -394,6 +488,9 @@ def remove(
 @app.command(name="list")
 def list_projects():
     """List all registered projects."""
+    from rich.table import Table
+    from .store import load_config
+    
     config = load_config()
     
     if not config.projects:
@@ -407,11 +504,26 @@ def list_projects():
     table.add_column("Tags", style="green")
     table.add_column(".ai/ exists", style="yellow")
     
-    for p in config.projects:
-        ai_exists = "✓" if p.full_ai_path.exists() else "✗"
+    ai_dirs_exist = _paths_exist([p.full_ai_path for p in config.projects])
+    for p, exists in zip(config.projects, ai_dirs_exist):
+        ai_exists = "✓" if exists else "✗"
         table.add_row(p.name, str(p.path), ", ".join(p.tags) or "-", ai_exists)
     
-    console.print(table)
+    _console().print(table)
+
+
+def _paths_exist(paths: list[Path]) -> list[bool]:
+    """Check which paths exist, statting them concurrently when there are many.
+    
+    Registered projects can live on network mounts where each stat is a
+    round trip; a handful of local paths isn't worth starting threads for.
+    """
+    if len(paths) <= 4:
+        return [p.exists() for p in paths]
+    
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(32, len(paths))) as pool:
+        return list(pool.map(Path.exists, paths))
 
 
 @app.command()
@@ -419,6 +531,10 @@ def index(
     refresh: Annotated[bool, typer.Option("--refresh", "-r", help="Force rebuild index")] = False,
 ):
     """Build or refresh the knowledge index."""
+    from .indexer import build_full_index
+    from .models import NodeType
+    from .store import get_index_path, load_config, load_index, save_index
+    
     config = load_config()
     
     existing = load_index()
@@ -447,13 +563,16 @@ def index(
 @app.command()
 def tree():
     """Display the knowledge tree structure."""
-    index = load_index()
+    from rich.panel import Panel
+    from .store import load_toc
     
-    if not index:
+    toc_text = load_toc()
+    
+    if toc_text is None:
         rprint("[yellow]No index found.[/yellow] Run 'adt index' first.")
         return
     
-    rprint(Panel(index.to_toc(), title="Knowledge Tree", border_style="blue"))
+    rprint(Panel(toc_text, title="Knowledge Tree", border_style="blue"))
 
 
 @app.command()
@@ -461,16 +580,24 @@ def toc(
     format: Annotated[str, typer.Option("--format", "-f", help="Output format: text, json")] = "text",
 ):
     """Output the table of contents for LLM consumption."""
-    index = load_index()
+    from .store import load_compact_json, load_toc
     
-    if not index:
+    text = load_compact_json() if format == "json" else load_toc()
+    
+    if text is None:
         rprint("[yellow]No index found.[/yellow] Run 'adt index' first.")
         raise typer.Exit(1)
     
-    if format == "json":
-        print(json.dumps(index.to_compact_json(), indent=2))
-    else:
-        print(index.to_toc())
+    print(text)
+
+
+_NODE_PANEL_TMPL = (
+    "[bold]Name:[/bold] {name}\n"
+    "[bold]Type:[/bold] {type}\n"
+    "[bold]Summary:[/bold] {summary}\n"
+    "[bold]File:[/bold] {file_path}"
+)
+_NODE_LINES_TMPL = "\n[bold]Lines:[/bold] {start_line}-{end_line}"
 
 
 @app.command()
@@ -479,6 +606,9 @@ def get(
     content: Annotated[bool, typer.Option("--content", "-c", help="Include file content")] = False,
 ):
     """Retrieve a specific node by ID."""
+    from rich.panel import Panel
+    from .store import load_index
+    
     index = load_index()
     
     if not index:
@@ -491,21 +621,38 @@ def get(
         rprint(f"[red]Error:[/red] Node not found: {node_id}")
         raise typer.Exit(1)
     
+    body = _NODE_PANEL_TMPL.format_map({
+        "name": node.name,
+        "type": node.node_type.value,
+        "summary": node.summary or "N/A",
+        "file_path": node.file_path or "N/A",
+    })
+    if node.start_line is not None:
+        body += _NODE_LINES_TMPL.format(start_line=node.start_line, end_line=node.end_line)
+    
     rprint(Panel(
-        f"[bold]Name:[/bold] {node.name}\n"
-        f"[bold]Type:[/bold] {node.node_type.value}\n"
-        f"[bold]Summary:[/bold] {node.summary or 'N/A'}\n"
-        f"[bold]File:[/bold] {node.file_path or 'N/A'}\n"
-        f"[bold]Lines:[/bold] {node.start_line}-{node.end_line}" if node.start_line else "",
+        body,
         title=f"Node: {node_id}",
         border_style="cyan"
     ))
     
-    if content and node.file_path and node.file_path.exists():
-        file_content = node.file_path.read_text()
-        if node.start_line is not None and node.end_line is not None:
-            lines = file_content.split("\n")
-            file_content = "\n".join(lines[node.start_line:node.end_line + 1])
+    if content and node.file_path:
+        # Open directly instead of stat-ing first; a missing file shows no content
+        try:
+            if node.start_line is not None and node.end_line is not None:
+                # Read only up to the end of the section rather than the whole file
+                from itertools import islice
+                
+                wanted = node.end_line + 1 - node.start_line
+                with node.file_path.open() as f:
+                    lines = list(islice(f, node.start_line, node.end_line + 1))
+                file_content = "".join(lines)
+                if len(lines) == wanted:
+                    file_content = file_content.removesuffix("\n")
+            else:
+                file_content = node.file_path.read_text()
+        except FileNotFoundError:
+            return
         rprint(Panel(file_content, title="Content", border_style="green"))
 
 
@@ -515,6 +662,10 @@ def search(
     tag: Annotated[Optional[str], typer.Option("--tag", "-t", help="Filter by tag")] = None,
 ):
     """Search the knowledge base."""
+    import heapq
+    from rich.table import Table
+    from .store import load_index
+    
     index = load_index()
     
     if not index:
@@ -522,31 +673,36 @@ def search(
         raise typer.Exit(1)
     
     results = []
-    query_lower = query.lower()
-    
-    def search_node(node: "KnowledgeNode"):
-        if tag and tag not in node.tags:
-            return
+    # Substring tests on casefolded keys measured several times faster than
+    # an re.IGNORECASE pattern over the raw name/summary, so no regex here.
+    query_key = query.casefold()
+    
+    # Depth-first walk with an explicit stack; children are pushed in reverse
+    # so results keep document order for equal scores.
+    stack = [index]
+    while stack:
+        node = stack.pop()
+        name_key, summary_key, tag_set = node.search_key()
+        if tag and tag not in tag_set:
+            continue
         
         match_score = 0
-        if query_lower in node.name.lower():
+        if query_key in name_key:
             match_score += 2
-        if node.summary and query_lower in node.summary.lower():
+        if summary_key and query_key in summary_key:
             match_score += 1
         
         if match_score > 0:
             results.append((node, match_score))
         
-        for child in node.children:
-            search_node(child)
-    
-    search_node(index)
+        stack.extend(reversed(node.children))
     
     if not results:
         rprint(f"[yellow]No results for:[/yellow] {query}")
         return
     
-    results.sort(key=lambda x: x[1], reverse=True)
+    # Partial sort: only the ten best matches are shown. Ties keep walk order.
+    top = heapq.nlargest(10, results, key=lambda x: x[1])
     
     table = Table(title=f"Search Results: '{query}'")
     table.add_column("ID", style="cyan")
@@ -554,11 +710,11 @@ def search(
     table.add_column("Type", style="green")
     table.add_column("Summary")
     
-    for node, _ in results[:10]:
+    for node, _ in top:
         summary = (node.summary[:50] + "...") if node.summary and len(node.summary) > 50 else (node.summary or "-")
         table.add_row(node.id, node.name, node.node_type.value, summary)
     
-    console.print(table)
+    _console().print(table)
 
 
 @app.command()
@@ -567,25 +723,35 @@ def context(
     output: Annotated[str, typer.Option("--output", "-o", help="Output format: text, json, markdown")] = "markdown",
 ):
     """Generate context for an AI assistant session."""
-    index = load_index()
-    config = load_config()
-    
-    if not index:
-        rprint("[yellow]No index found.[/yellow] Run 'adt index' first.")
-        raise typer.Exit(1)
-    
-    if output == "json":
-        if project:
+    from .jsonutil import dumps
+    from .models import NodeType
+    from .store import load_compact_json, load_index, load_toc
+    
+    # Only a single-project JSON view needs the full index; the rest use the
+    # views pre-rendered by save_index.
+    if output == "json" and project:
+        index = load_index()
+        text = None
+        if index:
             proj_node = next(
                 (n for n in index.find_by_type(NodeType.PROJECT) if n.name == project),
                 None
             )
-            if proj_node:
-                print(json.dumps(proj_node.to_compact_json(), indent=2))
-            else:
+            if not proj_node:
                 rprint(f"[red]Error:[/red] Project not found: {project}")
-        else:
-            print(json.dumps(index.to_compact_json(), indent=2))
+                return
+            text = dumps(proj_node.to_compact_json())
+    elif output == "json":
+        text = load_compact_json()
+    else:
+        text = load_toc()
+    
+    if text is None:
+        rprint("[yellow]No index found.[/yellow] Run 'adt index' first.")
+        raise typer.Exit(1)
+    
+    if output == "json":
+        print(text)
     else:
         lines = ["# AI Knowledge Context", ""]
         lines.append("## How to Use This Index")
@@ -597,7 +763,7 @@ def context(
         lines.append("## Table of Contents")
         lines.append("")
         lines.append("```")
-        lines.append(index.to_toc())
+        lines.append(text)
         lines.append("```")
         
         print("\n".join(lines))
@@ -614,6 +780,8 @@ def learn(
 ):
     """Add a new learning entry."""
     from datetime import datetime
+    from .indexer import build_full_index, reindex_file
+    from .store import load_config, load_index, save_index
     
     config = load_config()
     
@@ -635,7 +803,9 @@ def learn(
     else:
         learnings_path = config.global_ai_dir / "learnings.md"
     
-    if not learnings_path.exists():
+    try:
+        content = learnings_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         rprint(f"[red]Error:[/red] Learnings file not found: {learnings_path}")
         raise typer.Exit(1)
     
@@ -651,30 +821,35 @@ def learn(
     if context_text:
         entry += f"\n**Context:** {context_text}\n"
     
-    content = learnings_path.read_text()
-    
+    # Locate the insertion point once and splice the entry in with one copy
     insert_marker = "<!-- New entries are added below this line -->"
-    if insert_marker in content:
-        new_content = content.replace(insert_marker, insert_marker + "\n" + entry)
-    elif "---\n" in content:
-        parts = content.split("---\n", 1)
-        new_content = parts[0] + "---\n" + entry + "\n" + parts[1].lstrip()
+    pos = content.find(insert_marker)
+    if pos != -1:
+        pos += len(insert_marker)
+        before, after = content[:pos], content[pos:]
+        entry = "\n" + entry
+    elif (pos := content.find("---\n")) != -1:
+        pos += len("---\n")
+        before, after = content[:pos], "\n" + content[pos:].lstrip()
     else:
-        new_content = content.rstrip() + "\n" + entry
+        before, after = content.rstrip() + "\n", ""
     
-    if "*No entries yet.*" in new_content:
-        new_content = new_content.replace("*No entries yet.*", "")
+    # Drop the template's placeholder now that there is an entry; it can sit
+    # on either side of the insertion point
+    new_content = "".join((before, entry, after)).replace("*No entries yet.*", "")
     
-    learnings_path.write_text(new_content)
+    learnings_path.write_text(new_content, encoding="utf-8")
     
     scope = f"project '{project}'" if project else "global"
     rprint(f"[green]✓[/green] Added learning to {scope}: {title}")
     
     adt_index = load_index()
     if adt_index:
-        rprint("   Rebuilding index...")
-        new_index = build_full_index(config)
-        save_index(new_index)
+        rprint("   Updating index...")
+        # Only the learnings file changed, so re-parse just that document
+        if not reindex_file(adt_index, learnings_path):
+            adt_index = build_full_index(config)
+        save_index(adt_index)
         rprint("   [green]✓[/green] Index updated")
 
 
@@ -685,9 +860,44 @@ def watch():
     watch_knowledge_dirs()
 
 
+@app.command()
+def daemon():
+    """Serve adt commands over a Unix socket for the fast `adtc` client."""
+    from .daemon import get_socket_path, serve
+    
+    rprint(f"[green]✓[/green] Listening on {get_socket_path()}")
+    rprint("[dim]Run commands with adtc instead of adt. Press Ctrl+C to stop[/dim]")
+    try:
+        serve(_run_forwarded)
+    except RuntimeError as e:
+        rprint(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+def _run_forwarded(argv: list[str], request: dict) -> int:
+    """Run one command for a daemon client and return its exit code."""
+    from rich.console import Console
+    global _console_instance, _agent_manager_instance
+    
+    # Render for the client's terminal, and reload agent state per command
+    # since agents change between calls. Config, index, skill and tool
+    # caches are keyed by file stat and stay valid across commands.
+    _console_instance = Console(force_terminal=bool(request.get("tty")), width=request.get("columns"))
+    _agent_manager_instance = None
+    try:
+        _build_app(argv)(args=argv[1:], prog_name="adt")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
+
+
 # Run subcommand group (unified execution)
-run_app = typer.Typer(help="Run skills or tools")
-app.add_typer(run_app, name="run")
+run_app = typer.Typer(help="Run skills or tools", rich_markup_mode=_HELP_MARKUP)
 
 
 @run_app.command("skill")
@@ -698,6 +908,8 @@ def run_skill(
     json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
 ):
     """Execute a skill by running all its referenced tools."""
+    from rich.panel import Panel
+    from .jsonutil import dumps
     from .skill_executor import (
         execute_skill,
         format_techdebt_report,
@@ -724,7 +936,7 @@ def run_skill(
         raise typer.Exit(1)
     
     if json_output:
-        print(json.dumps(results, indent=2, default=str))
+        print(dumps(results))
     else:
         # Use specialized formatter for known skills
         if skill_name in ("techdebt", "Find Tech Debt"):
@@ -735,6 +947,47 @@ def run_skill(
         rprint(Panel(report, title=f"Skill: {results.get('skill', skill_name)}", border_style="green"))
 
 
+def _match_prefix(kind: str, name: str, matches: list[str], resolve: bool = True, file=None) -> str:
+    """Return the only prefix match for name, or report it as not found and exit.
+    
+    Matches are listed as suggestions when there are several, or when
+    resolve is False (commands that run something shouldn't guess).
+    """
+    if resolve and len(matches) == 1:
+        return matches[0]
+    rprint(f"[red]Error:[/red] {kind} not found: {name}", file=file)
+    if matches:
+        rprint(f"Did you mean: {', '.join(matches)}", file=file)
+    raise typer.Exit(1)
+
+
+# First characters json.loads can accept; anything else is taken as a plain string
+_JSON_START = frozenset('{["-0123456789tfnNI \t\n\r')
+
+
+def _parse_tool_args(args: list[str] | None) -> dict:
+    """Parse key=value arguments, decoding values that are valid JSON."""
+    import json
+    
+    kwargs = {}
+    for arg in args or ():
+        key, sep, value = arg.partition("=")
+        if not sep:
+            rprint(f"[red]Error:[/red] Invalid argument format: {arg}")
+            rprint("Use key=value format")
+            raise typer.Exit(1)
+        
+        # Try to parse as JSON for complex types
+        if value[:1] in _JSON_START:
+            try:
+                kwargs[key] = json.loads(value)
+                continue
+            except json.JSONDecodeError:
+                pass
+        kwargs[key] = value
+    return kwargs
+
+
 @run_app.command("tool")
 def run_tool(
     name: Annotated[str, typer.Argument(help="Tool name (e.g., find_todos, git_status_summary)")],
@@ -742,39 +995,28 @@ def run_tool(
     json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
 ):
     """Execute a tool and display results."""
+    from rich.panel import Panel
+    from .jsonutil import dumps
     from .tools import load_all_tools
+    from .store import load_config
     
     config = load_config()
     registry = load_all_tools(config)
     t = registry.get(name)
     
     if not t:
-        rprint(f"[red]Error:[/red] Tool not found: {name}")
-        raise typer.Exit(1)
+        _match_prefix("Tool", name, registry.find_prefix(name), resolve=False)
     
-    # Parse arguments
-    kwargs = {}
-    if args:
-        for arg in args:
-            if "=" in arg:
-                key, value = arg.split("=", 1)
-                try:
-                    kwargs[key] = json.loads(value)
-                except json.JSONDecodeError:
-                    kwargs[key] = value
-            else:
-                rprint(f"[red]Error:[/red] Invalid argument format: {arg}")
-                rprint("Use key=value format")
-                raise typer.Exit(1)
+    kwargs = _parse_tool_args(args)
     
     try:
         result = t(**kwargs)
         
         if json_output:
-            print(json.dumps({"result": result}, indent=2, default=str))
+            print(dumps({"result": result}))
         else:
             if isinstance(result, (list, dict)):
-                rprint(Panel(json.dumps(result, indent=2, default=str), title="Result"))
+                rprint(Panel(dumps(result), title="Result"))
             else:
                 rprint(f"[green]Result:[/green] {result}")
     except Exception as e:
@@ -783,8 +1025,7 @@ def run_tool(
 
 
 # Skills subcommand group (for management: list, show, new)
-skills_app = typer.Typer(help="Manage reusable AI skills/workflows")
-app.add_typer(skills_app, name="skill")
+skills_app = typer.Typer(help="Manage reusable AI skills/workflows", rich_markup_mode=_HELP_MARKUP)
 
 
 @skills_app.command("new")
@@ -795,6 +1036,7 @@ def skill_new(
 ):
     """Create a new skill from template."""
     from .skills import create_skill_template, generate_skill_id
+    from .store import load_config
     
     config = load_config()
     
@@ -829,7 +1071,9 @@ def skill_list(
     project: Annotated[Optional[str], typer.Option("--project", "-p", help="Filter by project")] = None,
 ):
     """List all available skills."""
+    from rich.table import Table
     from .skills import load_all_skills, load_skills_from_dir
+    from .store import load_config
     
     config = load_config()
     
@@ -862,7 +1106,18 @@ def skill_list(
             desc.replace("\n", " "),
         )
     
-    console.print(table)
+    _console().print(table)
+
+
+_SKILL_PANEL_TMPL = (
+    "[bold]Name:[/bold] {name}\n"
+    "[bold]Trigger:[/bold] {trigger}\n"
+    "[bold]Scope:[/bold] {scope}\n"
+    "[bold]File:[/bold] {file_path}\n"
+    "[bold]Tags:[/bold] {tags}\n\n"
+    "[bold]Description:[/bold]\n{description}\n\n"
+    "[bold]Steps:[/bold]\n{steps}"
+)
 
 
 @skills_app.command("show")
@@ -871,32 +1126,33 @@ def skill_show(
     prompt: Annotated[bool, typer.Option("--prompt", help="Output as LLM prompt")] = False,
 ):
     """Show details of a specific skill."""
-    from .skills import load_all_skills
+    from rich.panel import Panel
+    from .skills import SkillIndex, load_all_skills
+    from .store import load_config, load_prompt
     
     config = load_config()
-    skills = load_all_skills(config)
+    skills = SkillIndex(load_all_skills(config))
     
     # Find by name or trigger
-    skill = next(
-        (s for s in skills if s.name.lower() == name.lower() or s.trigger == name),
-        None
-    )
+    skill = skills.find(name, name)
     
     if not skill:
-        rprint(f"[red]Error:[/red] Skill not found: {name}")
-        raise typer.Exit(1)
+        matches = [s.name for s in skills.find_prefix(name)]
+        skill = skills.find(_match_prefix("Skill", name, matches))
     
     if prompt:
-        print(skill.to_prompt())
+        print(load_prompt(skill))
     else:
         rprint(Panel(
-            f"[bold]Name:[/bold] {skill.name}\n"
-            f"[bold]Trigger:[/bold] {skill.trigger or 'N/A'}\n"
-            f"[bold]Scope:[/bold] {skill.scope}\n"
-            f"[bold]File:[/bold] {skill.file_path}\n"
-            f"[bold]Tags:[/bold] {', '.join(skill.tags) or 'N/A'}\n\n"
-            f"[bold]Description:[/bold]\n{skill.description}\n\n"
-            f"[bold]Steps:[/bold]\n" + "\n".join(f"  {i}. {s}" for i, s in enumerate(skill.steps, 1)),
+            _SKILL_PANEL_TMPL.format_map({
+                "name": skill.name,
+                "trigger": skill.trigger or "N/A",
+                "scope": skill.scope,
+                "file_path": skill.file_path,
+                "tags": ", ".join(skill.tags) or "N/A",
+                "description": skill.description,
+                "steps": "\n".join(f"  {i}. {s}" for i, s in enumerate(skill.steps, 1)),
+            }),
             title=f"Skill: {skill.name}",
             border_style="cyan"
         ))
@@ -907,30 +1163,26 @@ def skill_prompt(
     name: Annotated[str, typer.Argument(help="Skill name or trigger")],
 ):
     """Output skill as LLM prompt (for piping to AI tools)."""
-    from .skills import load_all_skills
+    from .skills import SkillIndex, load_all_skills
+    from .store import load_config, load_prompt
     
     config = load_config()
-    skills = load_all_skills(config)
+    skills = SkillIndex(load_all_skills(config))
     
     # Normalize name
     skill_name = name.lstrip("/")
     
-    skill = next(
-        (s for s in skills if s.name.lower() == skill_name.lower() 
-         or s.trigger == name or s.trigger == f"/{skill_name}"),
-        None
-    )
+    skill = skills.find(skill_name, name, f"/{skill_name}")
     
     if not skill:
-        rprint(f"[red]Error:[/red] Skill not found: {name}", file=__import__("sys").stderr)
-        raise typer.Exit(1)
+        matches = [s.name for s in skills.find_prefix(skill_name)]
+        skill = skills.find(_match_prefix("Skill", name, matches, file=sys.stderr))
     
-    print(skill.to_prompt())
+    print(load_prompt(skill))
 
 
 # Tools subcommand group
-tools_app = typer.Typer(help="Manage reusable code tools/functions")
-app.add_typer(tools_app, name="tool")
+tools_app = typer.Typer(help="Manage reusable code tools/functions", rich_markup_mode=_HELP_MARKUP)
 
 
 @tools_app.command("new")
@@ -940,6 +1192,8 @@ def tool_new(
     project: Annotated[Optional[str], typer.Option("--project", "-p", help="Project (omit for global)")] = None,
 ):
     """Create a new tool from template."""
+    from .store import load_config
+    
     config = load_config()
     
     if project:
@@ -957,10 +1211,6 @@ def tool_new(
     tool_filename = name.lower().replace("-", "_").replace(" ", "_")
     tool_path = tools_dir / f"{tool_filename}.py"
     
-    if tool_path.exists():
-        rprint(f"[red]Error:[/red] Tool file already exists: {tool_path}")
-        raise typer.Exit(1)
-    
     func_name = tool_filename
     desc = description or f"Description for {name}"
     
@@ -981,7 +1231,9 @@ def {func_name}() -> str:
     return "Not implemented"
 '''
     
-    tool_path.write_text(template)
+    if not _write_templates([(tool_path, template)]):
+        rprint(f"[red]Error:[/red] Tool file already exists: {tool_path}")
+        raise typer.Exit(1)
     
     scope = f"project '{project}'" if project else "global"
     rprint(f"[green]✓[/green] Created tool in {scope}: {tool_path}")
@@ -994,7 +1246,9 @@ def tool_list(
     tag: Annotated[Optional[str], typer.Option("--tag", "-t", help="Filter by tag")] = None,
 ):
     """List all available tools."""
+    from rich.table import Table
     from .tools import load_all_tools
+    from .store import load_config
     
     config = load_config()
     registry = load_all_tools(config)
@@ -1019,7 +1273,19 @@ def tool_list(
             ", ".join(t.tags) or "-",
         )
     
-    console.print(table)
+    _console().print(table)
+
+
+_TOOL_PANEL_TMPL = (
+    "[bold]Name:[/bold] {name}\n"
+    "[bold]Signature:[/bold] {signature}\n"
+    "[bold]Scope:[/bold] {scope}\n"
+    "[bold]File:[/bold] {file_path}\n"
+    "[bold]Tags:[/bold] {tags}\n\n"
+    "[bold]Description:[/bold]\n{description}\n\n"
+    "[bold]Parameters:[/bold]\n{params}\n\n"
+    "[bold]Returns:[/bold] {returns}"
+)
 
 
 @tools_app.command("show")
@@ -1028,18 +1294,16 @@ def tool_show(
     prompt: Annotated[bool, typer.Option("--prompt", help="Output as LLM prompt")] = False,
 ):
     """Show details of a specific tool."""
+    from rich.panel import Panel
     from .tools import load_all_tools
+    from .store import load_config, load_prompt
     
     config = load_config()
     registry = load_all_tools(config)
-    t = registry.get(name)
-    
-    if not t:
-        rprint(f"[red]Error:[/red] Tool not found: {name}")
-        raise typer.Exit(1)
+    t = registry.get(name) or registry.get(_match_prefix("Tool", name, registry.find_prefix(name)))
     
     if prompt:
-        print(t.to_prompt())
+        print(load_prompt(t))
     else:
         params_str = "\n".join(
             f"  - {p.name} ({p.type}): {'required' if p.required else 'optional'}"
@@ -1047,14 +1311,16 @@ def tool_show(
         ) or "  (none)"
         
         rprint(Panel(
-            f"[bold]Name:[/bold] {t.name}\n"
-            f"[bold]Signature:[/bold] {t.to_signature()}\n"
-            f"[bold]Scope:[/bold] {t.scope}\n"
-            f"[bold]File:[/bold] {t.file_path}\n"
-            f"[bold]Tags:[/bold] {', '.join(t.tags) or 'N/A'}\n\n"
-            f"[bold]Description:[/bold]\n{t.description}\n\n"
-            f"[bold]Parameters:[/bold]\n{params_str}\n\n"
-            f"[bold]Returns:[/bold] {t.returns}",
+            _TOOL_PANEL_TMPL.format_map({
+                "name": t.name,
+                "signature": t.to_signature(),
+                "scope": t.scope,
+                "file_path": t.file_path,
+                "tags": ", ".join(t.tags) or "N/A",
+                "description": t.description,
+                "params": params_str,
+                "returns": t.returns,
+            }),
             title=f"Tool: {t.name}",
             border_style="cyan"
         ))
@@ -1066,16 +1332,13 @@ def tool_prompt(
 ):
     """Output tool documentation as LLM prompt."""
     from .tools import load_all_tools
+    from .store import load_config, load_prompt
     
     config = load_config()
     registry = load_all_tools(config)
-    t = registry.get(name)
-    
-    if not t:
-        rprint(f"[red]Error:[/red] Tool not found: {name}")
-        raise typer.Exit(1)
+    t = registry.get(name) or registry.get(_match_prefix("Tool", name, registry.find_prefix(name)))
     
-    print(t.to_prompt())
+    print(load_prompt(t))
 
 
 # Keep old tool run as hidden alias for backwards compatibility
@@ -1086,40 +1349,28 @@ def tool_run_legacy(
     json_output: Annotated[bool, typer.Option("--json", "-j", help="Output as JSON")] = False,
 ):
     """[Deprecated] Use 'adt run tool <name>' instead."""
+    from rich.panel import Panel
+    from .jsonutil import dumps
     from .tools import load_all_tools
+    from .store import load_config
     
     config = load_config()
     registry = load_all_tools(config)
     t = registry.get(name)
     
     if not t:
-        rprint(f"[red]Error:[/red] Tool not found: {name}")
-        raise typer.Exit(1)
+        _match_prefix("Tool", name, registry.find_prefix(name), resolve=False)
     
-    # Parse arguments
-    kwargs = {}
-    if args:
-        for arg in args:
-            if "=" in arg:
-                key, value = arg.split("=", 1)
-                # Try to parse as JSON for complex types
-                try:
-                    kwargs[key] = json.loads(value)
-                except json.JSONDecodeError:
-                    kwargs[key] = value
-            else:
-                rprint(f"[red]Error:[/red] Invalid argument format: {arg}")
-                rprint("Use key=value format")
-                raise typer.Exit(1)
+    kwargs = _parse_tool_args(args)
     
     try:
         result = t(**kwargs)
         
         if json_output:
-            print(json.dumps({"result": result}, indent=2, default=str))
+            print(dumps({"result": result}))
         else:
             if isinstance(result, (list, dict)):
-                rprint(Panel(json.dumps(result, indent=2, default=str), title="Result"))
+                rprint(Panel(dumps(result), title="Result"))
             else:
                 rprint(f"[green]Result:[/green] {result}")
     except Exception as e:
@@ -1132,14 +1383,16 @@ def tool_docs(
     output: Annotated[str, typer.Option("--output", "-o", help="Output format: text, json")] = "text",
 ):
     """Generate documentation for all tools."""
+    from .jsonutil import dumps
     from .tools import load_all_tools
+    from .store import load_config
     
     config = load_config()
     registry = load_all_tools(config)
     
     if output == "json":
         tools_data = [t.to_dict() for t in registry.list()]
-        print(json.dumps(tools_data, indent=2))
+        print(dumps(tools_data))
     else:
         print(registry.to_prompt())
 
@@ -1148,8 +1401,102 @@ def tool_docs(
 # Server Commands (Command Center)
 # =============================================================================
 
-server_app = typer.Typer(help="ADT Command Center server")
-app.add_typer(server_app, name="server")
+server_app = typer.Typer(help="ADT Command Center server", rich_markup_mode=_HELP_MARKUP)
+
+# Files of the background server started with `adt server start --daemon`
+_SERVER_PID_PATH = Path.home() / ".adt" / "server.pid"
+_SERVER_LOG_PATH = Path.home() / ".adt" / "logs" / "server.log"
+
+
+def _proc_start_time(pid: int) -> str | None:
+    """Start time of a process from /proc/<pid>/stat, or None if it isn't running.
+    
+    Saved next to the server PID so a recycled PID isn't mistaken for the server.
+    """
+    try:
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return None
+    # Field 2 (comm) may contain spaces; starttime is field 22 overall
+    return stat.rsplit(")", 1)[1].split()[19]
+
+
+def _pid_alive(pid: int, start_time: str | None = None) -> bool:
+    """Check whether pid is running and, if start_time is given, is still the same process."""
+    if sys.platform == "linux":
+        current = _proc_start_time(pid)
+        return current is not None and (start_time is None or current == start_time)
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _signal_pid(pid: int, sig: int, start_time: str | None = None) -> None:
+    """Send sig to pid, raising ProcessLookupError if it isn't the recorded process.
+    
+    Where pidfd_open is available the process is pinned by a pidfd before
+    the start-time check, so a PID recycled in between can't be signalled.
+    """
+    import errno
+    import signal
+    
+    try:
+        pidfd = os.pidfd_open(pid)
+    except (AttributeError, OSError) as e:
+        # No pidfd support (non-Linux, old kernel): check and kill separately
+        if isinstance(e, ProcessLookupError):
+            raise
+        if start_time and not _pid_alive(pid, start_time):
+            raise ProcessLookupError(errno.ESRCH, "No such process")
+        os.kill(pid, sig)
+        return
+    try:
+        if start_time and not _pid_alive(pid, start_time):
+            raise ProcessLookupError(errno.ESRCH, "No such process")
+        signal.pidfd_send_signal(pidfd, sig)
+    finally:
+        os.close(pidfd)
+
+
+def _read_server_pid(pid_path: Path) -> tuple[int, str | None]:
+    """Read the server PID file: the PID, then the process start time if recorded."""
+    pid_text, _, start_time = pid_path.read_text().strip().partition("\n")
+    return int(pid_text), start_time.strip() or None
+
+
+def _spawn_daemon(cmd: list[str], log_path: Path) -> int:
+    """Start cmd in a new session with stdout/stderr appended to log_path; return its PID.
+    
+    Uses posix_spawn so the child is started without forking this process;
+    falls back to subprocess where posix_spawn can't start a new session.
+    """
+    if hasattr(os, "posix_spawn"):
+        try:
+            return os.posix_spawn(
+                cmd[0],
+                cmd,
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, str(log_path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644),
+                    (os.POSIX_SPAWN_DUP2, 1, 2),
+                ],
+                setsid=True,
+            )
+        except NotImplementedError:
+            pass
+    
+    import subprocess
+    
+    with open(log_path, "a") as log_file:
+        process = subprocess.Popen(
+            cmd,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+    return process.pid
 
 
 @server_app.command("start")
@@ -1197,45 +1544,38 @@ def server_start(
     
     if daemon:
         # Run in background
-        import subprocess
-        import sys
-        
-        log_path = Path.home() / ".adt" / "logs" / "server.log"
+        log_path = _SERVER_LOG_PATH
         log_path.parent.mkdir(parents=True, exist_ok=True)
         
-        cmd = [sys.executable, "-m", "uvicorn"] + uvicorn_args
-        
-        with open(log_path, "a") as log_file:
-            process = subprocess.Popen(
-                cmd,
-                stdout=log_file,
-                stderr=subprocess.STDOUT,
-                start_new_session=True,
-            )
+        pid = _spawn_daemon([sys.executable, "-m", "uvicorn"] + uvicorn_args, log_path)
         
-        # Save PID
-        pid_path = Path.home() / ".adt" / "server.pid"
-        pid_path.write_text(str(process.pid))
+        # Save PID (and start time, where available, to detect PID reuse)
+        pid_path = _SERVER_PID_PATH
+        start_time = _proc_start_time(pid)
+        pid_path.write_text(f"{pid}\n{start_time}" if start_time else str(pid))
         
-        rprint(f"[green]✓[/green] Server started in background")
-        rprint(f"   PID: {process.pid}")
-        rprint(f"   URL: {protocol}://{host}:{port}")
-        rprint(f"   Logs: {log_path}")
+        lines = [
+            "[green]✓[/green] Server started in background",
+            f"   PID: {pid}",
+            f"   URL: {protocol}://{host}:{port}",
+            f"   Logs: {log_path}",
+        ]
         if use_tls:
-            rprint(f"   TLS: enabled")
-        rprint("")
-        rprint(f"Stop with: adt server stop")
+            lines.append("   TLS: enabled")
+        lines += ["", "Stop with: adt server stop"]
+        rprint("\n".join(lines))
         return
     
-    rprint(f"[bold]Starting ADT Command Center...[/bold]")
-    rprint(f"  URL: {protocol}://{host}:{port}")
-    rprint(f"  API docs: {protocol}://{host}:{port}/docs")
-    rprint(f"  WebSocket: {ws_protocol}://{host}:{port}/ws")
+    lines = [
+        "[bold]Starting ADT Command Center...[/bold]",
+        f"  URL: {protocol}://{host}:{port}",
+        f"  API docs: {protocol}://{host}:{port}/docs",
+        f"  WebSocket: {ws_protocol}://{host}:{port}/ws",
+    ]
     if use_tls:
-        rprint(f"  TLS: enabled")
-    rprint("")
-    rprint("[dim]Press Ctrl+C to stop[/dim]")
-    rprint("")
+        lines.append("  TLS: enabled")
+    lines += ["", "[dim]Press Ctrl+C to stop[/dim]", ""]
+    rprint("\n".join(lines))
     
     import uvicorn
     
@@ -1255,43 +1595,93 @@ def server_start(
 @server_app.command("status")
 def server_status():
     """Check server status."""
-    import urllib.request
-    import urllib.error
+    from concurrent.futures import ThreadPoolExecutor
     from .server.config import Config
     
     config = Config.load()
-    url = f"http://{config.server.host}:{config.server.port}/status"
+    host, port = config.server.host, config.server.port
     
-    # Check PID file
-    pid_path = Path.home() / ".adt" / "server.pid"
-    pid = None
-    if pid_path.exists():
-        try:
-            pid = int(pid_path.read_text().strip())
+    # A local server answers (or refuses) almost immediately; only remote
+    # hosts get the longer timeout.
+    timeout = 0.5 if host in _LOCAL_HOSTS else 2
+    
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        # Start the HTTP probe first so the PID check overlaps with it
+        probe = pool.submit(_probe_status, host, port, timeout)
+        
+        # Check PID file
+        pid_path = _SERVER_PID_PATH
+        pid = None
+        if pid_path.exists():
+            try:
+                pid, start_time = _read_server_pid(pid_path)
+            except (ValueError, OSError):
+                start_time = None
             # Check if process is running
-            os.kill(pid, 0)
-        except (ValueError, OSError):
-            pid = None
-            pid_path.unlink(missing_ok=True)
+            if pid is not None and not _pid_alive(pid, start_time):
+                pid = None
+            if pid is None:
+                pid_path.unlink(missing_ok=True)
+        
+        data = probe.result()
     
-    # Try to connect
-    try:
-        with urllib.request.urlopen(url, timeout=2) as response:
-            data = json.loads(response.read().decode())
-            
-            rprint("[green]● Server is running[/green]")
-            rprint(f"  URL: http://{config.server.host}:{config.server.port}")
-            if pid:
-                rprint(f"  PID: {pid}")
-            rprint(f"  Agents: {data.get('agents', {}).get('running', 0)} running")
-            rprint(f"  Tasks: {data.get('queue', {}).get('pending', 0)} pending")
-            rprint(f"  Clients: {data.get('connected_clients', 0)} connected")
-    except urllib.error.URLError:
+    if data is not None:
+        lines = ["[green]● Server is running[/green]", f"  URL: http://{host}:{port}"]
         if pid:
-            rprint(f"[yellow]● Server process exists (PID {pid}) but not responding[/yellow]")
-        else:
-            rprint("[dim]○ Server is not running[/dim]")
-            rprint(f"  Start with: adt server start")
+            lines.append(f"  PID: {pid}")
+        lines += [
+            f"  Agents: {data.get('agents', {}).get('running', 0)} running",
+            f"  Tasks: {data.get('queue', {}).get('pending', 0)} pending",
+            f"  Clients: {data.get('connected_clients', 0)} connected",
+        ]
+        rprint("\n".join(lines))
+    elif pid:
+        rprint(f"[yellow]● Server process exists (PID {pid}) but not responding[/yellow]")
+    else:
+        rprint("[dim]○ Server is not running[/dim]\n  Start with: adt server start")
+
+
+_LOCAL_HOSTS = frozenset({"127.0.0.1", "localhost", "0.0.0.0", "::1"})
+
+
+def _probe_status(host: str, port: int, timeout: float) -> dict | None:
+    """GET the server's /status endpoint; None if it can't be reached or answers garbage.
+    
+    Local servers are asked over a plain socket with a one-shot HTTP/1.0
+    request, which skips importing urllib's opener and http.client stack;
+    remote hosts go through urllib.
+    """
+    from .jsonutil import loads
+    
+    if host not in _LOCAL_HOSTS:
+        import urllib.request
+        try:
+            with urllib.request.urlopen(f"http://{host}:{port}/status", timeout=timeout) as response:
+                return loads(response.read())
+        except (OSError, ValueError):
+            return None
+    
+    import socket
+    
+    request = f"GET /status HTTP/1.0\r\nHost: {host}:{port}\r\n\r\n".encode()
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as sock:
+            sock.sendall(request)
+            chunks = []
+            # HTTP/1.0: the server closes the connection after the body
+            while chunk := sock.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        return None
+    
+    head, _, body = b"".join(chunks).partition(b"\r\n\r\n")
+    status_line = head.split(b"\r\n", 1)[0].split()
+    if len(status_line) < 2 or status_line[1] != b"200":
+        return None
+    try:
+        return loads(body)
+    except ValueError:
+        return None
 
 
 @server_app.command("stop")
@@ -1301,16 +1691,16 @@ def server_stop(
     """Stop the running server."""
     import signal
     
-    pid_path = Path.home() / ".adt" / "server.pid"
+    pid_path = _SERVER_PID_PATH
     
     if not pid_path.exists():
         rprint("[yellow]No server PID file found.[/yellow]")
         return
     
     try:
-        pid = int(pid_path.read_text().strip())
-        sig = signal.SIGKILL if force else signal.SIGTERM
-        os.kill(pid, sig)
+        pid, start_time = _read_server_pid(pid_path)
+        # Don't signal an unrelated process that reused the server's PID
+        _signal_pid(pid, signal.SIGKILL if force else signal.SIGTERM, start_time)
         pid_path.unlink()
         rprint(f"[green]✓[/green] Server stopped (PID {pid})")
     except ValueError:
@@ -1328,8 +1718,7 @@ def server_stop(
 # Config Commands
 # =============================================================================
 
-config_app = typer.Typer(help="Manage ADT configuration")
-app.add_typer(config_app, name="config")
+config_app = typer.Typer(help="Manage ADT configuration", rich_markup_mode=_HELP_MARKUP)
 
 
 @config_app.command("init")
@@ -1342,12 +1731,14 @@ def config_init(
     ensure_adt_home()
     config_path = get_adt_home() / "config.yml"
     
-    if config_path.exists() and not force:
+    template = get_default_config_template()
+    if force:
+        config_path.write_text(template)
+    elif not _write_templates([(config_path, template)]):
         rprint(f"[yellow]Config already exists:[/yellow] {config_path}")
         rprint("Use --force to overwrite")
         return
     
-    config_path.write_text(get_default_config_template())
     rprint(f"[green]✓[/green] Created config at {config_path}")
     rprint(f"   Edit to customize providers, channels, and agents")
 
@@ -1372,6 +1763,7 @@ def config_edit():
 @config_app.command("show")
 def config_show():
     """Show current configuration."""
+    from rich.panel import Panel
     from .server.config import Config, get_adt_home
     
     config_path = get_adt_home() / "config.yml"
@@ -1418,39 +1810,50 @@ def config_get_secret(
         raise typer.Exit(1)
 
 
+# ${SECRET_NAME} references in config.yml. The pattern starts with the
+# literal "${", which re uses to skip ahead between candidates, so this is
+# a single linear scan that also catches user-defined secret names.
+_SECRET_REF_RE = re.compile(r"\$\{([A-Z][A-Z0-9_]+)\}")
+
+# What each well-known secret is used for, shown next to its key
+_SECRET_DESCRIPTIONS = {
+    "ANTHROPIC_API_KEY": "Claude/Anthropic API",
+    "OPENAI_API_KEY": "OpenAI API",
+    "GEMINI_API_KEY": "Google Gemini API",
+    "TELEGRAM_BOT_TOKEN": "Telegram bot",
+    "TWILIO_SID": "Twilio account SID",
+    "TWILIO_TOKEN": "Twilio auth token",
+    "ADT_SECRET_KEY": "Server security",
+}
+
+
 @config_app.command("list-secrets")
 def config_list_secrets():
     """List stored secrets and show which ones are needed."""
+    from rich.table import Table
     from .server.vault import get_vault
     from .server.config import Config, get_adt_home
-    import re
     
     vault = get_vault()
     stored_keys = set(vault.list_keys())
     
-    # Find secrets actively used in config (not commented out)
-    active_secrets: dict[str, str] = {}
-    commented_secrets: dict[str, str] = {}
-    
     config_path = get_adt_home() / "config.yml"
-    if config_path.exists():
-        lines = config_path.read_text().split('\n')
-        for i, line in enumerate(lines):
-            # Skip lines that start with #
-            stripped = line.strip()
-            if stripped.startswith('#'):
-                # Check commented lines for potential secrets
-                for match in re.finditer(r'\$\{([A-Z][A-Z0-9_]+)\}', line):
-                    key = match.group(1)
-                    if key != "VAR_NAME":  # Skip example placeholder
-                        commented_secrets[key] = _get_secret_description(key)
-                continue
-            
-            # Active (uncommented) secrets
-            for match in re.finditer(r'\$\{([A-Z][A-Z0-9_]+)\}', line):
-                key = match.group(1)
-                if key != "VAR_NAME":
-                    active_secrets[key] = _get_secret_description(key)
+    try:
+        text = config_path.read_text()
+    except FileNotFoundError:
+        text = ""
+    
+    # Secrets actively used in config. One sweep over the whole file; a
+    # reference is commented out when its line starts with '#', found by
+    # looking back to the preceding newline.
+    active_secrets: set[str] = set()
+    for match in _SECRET_REF_RE.finditer(text):
+        key = match.group(1)
+        if key == "VAR_NAME":  # Skip example placeholder
+            continue
+        line_start = text.rfind("\n", 0, match.start()) + 1
+        if not text[line_start:match.start()].lstrip().startswith("#"):
+            active_secrets.add(key)
     
     # Display stored secrets
     if stored_keys:
@@ -1460,19 +1863,19 @@ def config_list_secrets():
         table.add_column("Used For")
         
         for key in sorted(stored_keys):
-            table.add_row(key, "[green]✓ set[/green]", _get_secret_description(key))
+            table.add_row(key, "[green]✓ set[/green]", _SECRET_DESCRIPTIONS.get(key, ""))
         
-        console.print(table)
+        _console().print(table)
     else:
         rprint("[dim]No secrets stored yet.[/dim]")
     
     # Show secrets needed (uncommented in config but not set)
-    needed = set(active_secrets.keys()) - stored_keys
+    needed = active_secrets - stored_keys
     if needed:
         rprint("")
         rprint("[yellow]Secrets needed (referenced in config):[/yellow]")
         for key in sorted(needed):
-            rprint(f"  [yellow]○[/yellow] {key} - {active_secrets[key]}")
+            rprint(f"  [yellow]○[/yellow] {key} - {_SECRET_DESCRIPTIONS.get(key, '')}")
         rprint("")
         rprint("[dim]Set with: adt config set-secret <KEY>[/dim]")
     
@@ -1486,20 +1889,6 @@ def config_list_secrets():
     rprint("  [dim]gemini[/dim] - Needs GEMINI_API_KEY")
 
 
-def _get_secret_description(key: str) -> str:
-    """Get description for a secret key."""
-    descriptions = {
-        "ANTHROPIC_API_KEY": "Claude/Anthropic API",
-        "OPENAI_API_KEY": "OpenAI API",
-        "GEMINI_API_KEY": "Google Gemini API",
-        "TELEGRAM_BOT_TOKEN": "Telegram bot",
-        "TWILIO_SID": "Twilio account SID",
-        "TWILIO_TOKEN": "Twilio auth token",
-        "ADT_SECRET_KEY": "Server security",
-    }
-    return descriptions.get(key, "")
-
-
 @config_app.command("delete-secret")
 def config_delete_secret(
     key: Annotated[str, typer.Argument(help="Secret key name")],
@@ -1518,8 +1907,7 @@ def config_delete_secret(
 # Token Commands
 # =============================================================================
 
-token_app = typer.Typer(help="Manage API tokens")
-app.add_typer(token_app, name="token")
+token_app = typer.Typer(help="Manage API tokens", rich_markup_mode=_HELP_MARKUP)
 
 
 @token_app.command("create")
@@ -1529,6 +1917,7 @@ def token_create(
     expires: Annotated[Optional[int], typer.Option("--expires", "-e", help="Expires in N days")] = None,
 ):
     """Create a new API token."""
+    from rich.panel import Panel
     from .server.auth import get_auth_manager, Role
     
     try:
@@ -1565,6 +1954,7 @@ def token_create(
 @token_app.command("list")
 def token_list():
     """List all API tokens."""
+    from rich.table import Table
     from .server.auth import get_auth_manager
     
     auth = get_auth_manager()
@@ -1639,20 +2029,38 @@ def token_delete(
 # Agent Commands
 # =============================================================================
 
-agent_app = typer.Typer(help="Manage AI agents")
-app.add_typer(agent_app, name="agent")
+agent_app = typer.Typer(help="Manage AI agents", rich_markup_mode=_HELP_MARKUP)
+
+# Rich style for each agent status in `adt agent list`
+_AGENT_STATUS_COLORS = {
+    "idle": "dim",
+    "working": "green",
+    "testing": "blue",
+    "waiting": "yellow",
+    "error": "red",
+    "stopped": "dim",
+}
+
+_agent_manager_instance = None
+
+
+def _agent_manager():
+    """Get the AgentManager for this process, loading config and agent state on first use."""
+    global _agent_manager_instance
+    if _agent_manager_instance is None:
+        from .server.config import Config, ensure_adt_home
+        from .server.agents import AgentManager
+        ensure_adt_home()
+        _agent_manager_instance = AgentManager(Config.load())
+    return _agent_manager_instance
 
 
 @agent_app.command("list")
 def agent_list():
     """List all agents."""
-    from .server.config import Config, ensure_adt_home
-    from .server.agents import AgentManager
-    
-    ensure_adt_home()
-    config = Config.load()
-    manager = AgentManager(config)
+    from rich.table import Table
     
+    manager = _agent_manager()
     agents = manager.list()
     
     if not agents:
@@ -1667,26 +2075,19 @@ def agent_list():
     table.add_column("Task")
     table.add_column("PID")
     
-    status_colors = {
-        "idle": "dim",
-        "working": "green",
-        "testing": "blue",
-        "waiting": "yellow",
-        "error": "red",
-        "stopped": "dim",
-    }
-    
     for agent in agents:
-        color = status_colors.get(agent.status.value, "white")
+        status = agent.status.value
+        color = _AGENT_STATUS_COLORS.get(status, "white")
+        task = agent.current_task or "-"
         table.add_row(
             agent.project,
-            f"[{color}]{agent.status.value}[/{color}]",
+            f"[{color}]{status}[/{color}]",
             agent.provider,
-            agent.current_task[:40] + "..." if agent.current_task and len(agent.current_task) > 40 else (agent.current_task or "-"),
+            task if len(task) <= 40 else task[:40] + "...",
             str(agent.pid) if agent.pid else "-",
         )
     
-    console.print(table)
+    _console().print(table)
 
 
 @agent_app.command("spawn")
@@ -1697,12 +2098,7 @@ def agent_spawn(
     worktree: Annotated[Optional[str], typer.Option("--worktree", "-w", help="Use specific worktree")] = None,
 ):
     """Spawn an agent for a project."""
-    from .server.config import Config, ensure_adt_home
-    from .server.agents import AgentManager
-    
-    ensure_adt_home()
-    config = Config.load()
-    manager = AgentManager(config)
+    manager = _agent_manager()
     
     try:
         state = manager.spawn(project, provider=provider, worktree=worktree, task=task)
@@ -1722,12 +2118,7 @@ def agent_stop(
     force: Annotated[bool, typer.Option("--force", "-f", help="Force kill")] = False,
 ):
     """Stop an agent."""
-    from .server.config import Config, ensure_adt_home
-    from .server.agents import AgentManager
-    
-    ensure_adt_home()
-    config = Config.load()
-    manager = AgentManager(config)
+    manager = _agent_manager()
     
     if manager.stop(project, force=force):
         rprint(f"[green]✓[/green] Stopped agent for {project}")
@@ -1735,6 +2126,93 @@ def agent_stop(
         rprint(f"[yellow]No agent found for {project}[/yellow]")
 
 
+def _inotify_writes(path: Path):
+    """Yield each time path is modified, using Linux inotify; None if unavailable."""
+    import ctypes
+    
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        inotify_fd = libc.inotify_init1(os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if inotify_fd < 0:
+        return None
+    IN_MODIFY = 0x2
+    if libc.inotify_add_watch(inotify_fd, os.fsencode(path), IN_MODIFY) < 0:
+        os.close(inotify_fd)
+        return None
+    
+    def events():
+        import select
+        try:
+            while True:
+                select.select([inotify_fd], [], [])
+                os.read(inotify_fd, 4096)
+                yield
+        finally:
+            os.close(inotify_fd)
+    
+    return events()
+
+
+def _kqueue_writes(fd: int):
+    """Yield each time the open file fd is written to, using BSD/macOS kqueue."""
+    import select
+    
+    kq = select.kqueue()
+    watch = select.kevent(
+        fd,
+        filter=select.KQ_FILTER_VNODE,
+        flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+        fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_EXTEND,
+    )
+    try:
+        kq.control([watch], 0)
+        while True:
+            kq.control(None, 1)
+            yield
+    finally:
+        kq.close()
+
+
+def _follow_log(log_path: Path, lines: int) -> None:
+    """Print the last lines of log_path, then stream appended output until Ctrl-C.
+    
+    Waits on inotify (Linux) or kqueue (BSD/macOS) in-process; other
+    platforms fall back to `tail -f`.
+    """
+    import select
+    
+    with open(log_path, "rb") as f:
+        if sys.platform == "linux":
+            writes = _inotify_writes(log_path)
+        elif hasattr(select, "kqueue"):
+            writes = _kqueue_writes(f.fileno())
+        else:
+            writes = None
+        if writes is None:
+            import subprocess
+            subprocess.run(["tail", "-n", str(lines), "-f", str(log_path)])
+            return
+        
+        out = sys.stdout.buffer
+        out.write(b"".join(f.read().splitlines(keepends=True)[-lines:]))
+        out.flush()
+        try:
+            for _ in writes:
+                if os.fstat(f.fileno()).st_size < f.tell():
+                    # Truncated (e.g. log reset on agent restart): start over
+                    f.seek(0)
+                chunk = f.read()
+                if chunk:
+                    out.write(chunk)
+                    out.flush()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            writes.close()
+
+
 @agent_app.command("logs")
 def agent_logs(
     project: Annotated[str, typer.Argument(help="Project name")],
@@ -1742,8 +2220,7 @@ def agent_logs(
     follow: Annotated[bool, typer.Option("--follow", "-f", help="Follow log output")] = False,
 ):
     """View agent logs."""
-    from .server.config import Config, ensure_adt_home, get_adt_home
-    from .server.agents import AgentManager
+    from .server.config import ensure_adt_home, get_adt_home
     
     ensure_adt_home()
     
@@ -1754,12 +2231,9 @@ def agent_logs(
         return
     
     if follow:
-        import subprocess
-        subprocess.run(["tail", "-f", str(log_path)])
+        _follow_log(log_path, lines)
     else:
-        config = Config.load()
-        manager = AgentManager(config)
-        logs = manager.get_logs(project, lines=lines)
+        logs = _agent_manager().get_logs(project, lines=lines)
         print(logs)
 
 
@@ -1769,12 +2243,7 @@ def agent_assign(
     task: Annotated[str, typer.Argument(help="Task description")],
 ):
     """Assign a task to an agent."""
-    from .server.config import Config, ensure_adt_home
-    from .server.agents import AgentManager
-    
-    ensure_adt_home()
-    config = Config.load()
-    manager = AgentManager(config)
+    manager = _agent_manager()
     
     try:
         state = manager.assign_task(project, task)
@@ -1790,12 +2259,9 @@ def agent_status(
     project: Annotated[str, typer.Argument(help="Project name")],
 ):
     """Get detailed status for an agent."""
-    from .server.config import Config, ensure_adt_home
-    from .server.agents import AgentManager
+    from rich.panel import Panel
     
-    ensure_adt_home()
-    config = Config.load()
-    manager = AgentManager(config)
+    manager = _agent_manager()
     
     agent = manager.get(project)
     
@@ -1822,22 +2288,38 @@ def agent_status(
 # Queue Commands
 # =============================================================================
 
-queue_app = typer.Typer(help="Manage task queue")
-app.add_typer(queue_app, name="queue")
+queue_app = typer.Typer(help="Manage task queue", rich_markup_mode=_HELP_MARKUP)
+
+_task_queue_instance = None
+
+
+def _task_queue():
+    """Get this process's TaskQueue, reloading it only if tasks.json changed on disk."""
+    global _task_queue_instance
+    from .server.config import ensure_adt_home
+    ensure_adt_home()
+    if _task_queue_instance is None:
+        from .server.queue import TaskQueue
+        _task_queue_instance = TaskQueue()
+    else:
+        _task_queue_instance.refresh()
+    return _task_queue_instance
 
 
 @queue_app.command("list")
 def queue_list(
     project: Annotated[Optional[str], typer.Option("--project", "-p", help="Filter by project")] = None,
     all_tasks: Annotated[bool, typer.Option("--all", "-a", help="Include completed tasks")] = False,
+    limit: Annotated[int, typer.Option("--limit", "-n", min=1, help="Maximum number of tasks to show")] = 50,
+    offset: Annotated[int, typer.Option("--offset", min=0, help="Skip this many tasks first")] = 0,
 ):
     """List tasks in the queue."""
-    from .server.queue import TaskQueue
-    from .server.config import ensure_adt_home
-    
-    ensure_adt_home()
-    queue = TaskQueue()
-    tasks = queue.list(project=project, include_completed=all_tasks)
+    from rich.table import Table
+    queue = _task_queue()
+    # One extra row tells whether another page follows
+    tasks = queue.list(project=project, include_completed=all_tasks, limit=limit + 1, offset=offset)
+    has_more = len(tasks) > limit
+    tasks = tasks[:limit]
     
     if not tasks:
         rprint("[yellow]No tasks in queue.[/yellow]")
@@ -1873,21 +2355,63 @@ def queue_list(
             task.assigned_to or "-",
         )
     
-    console.print(table)
+    _console().print(table)
+    if has_more:
+        rprint(f"[dim]Showing tasks {offset + 1}-{offset + limit}; use --offset {offset + limit} for more[/dim]")
 
 
 @queue_app.command("add")
 def queue_add(
-    project: Annotated[str, typer.Argument(help="Project name")],
-    description: Annotated[str, typer.Argument(help="Task description")],
+    project: Annotated[Optional[str], typer.Argument(help="Project name")] = None,
+    description: Annotated[Optional[str], typer.Argument(help="Task description")] = None,
     priority: Annotated[str, typer.Option("--priority", "-p", help="Priority: low, normal, high, urgent")] = "normal",
+    from_file: Annotated[Optional[Path], typer.Option("--from-file", "-f", help="Add tasks from a JSONL file ('-' for stdin)")] = None,
 ):
-    """Add a task to the queue."""
-    from .server.queue import TaskQueue, TaskPriority
-    from .server.config import ensure_adt_home
+    """Add a task to the queue, or many at once with --from-file.
     
-    ensure_adt_home()
-    queue = TaskQueue()
+    Each JSONL line is an object with project and description, an optional
+    priority, and any other keys as task metadata.
+    """
+    import json
+    from pydantic import ValidationError
+    from .server.queue import TaskPriority
+    
+    if from_file is not None:
+        from contextlib import nullcontext
+        
+        try:
+            # Leave stdin open for the caller; only close files opened here
+            source = nullcontext(sys.stdin) if str(from_file) == "-" else from_file.open(encoding="utf-8")
+        except OSError as e:
+            rprint(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+        specs = []
+        with source as stream:
+            for lineno, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                try:
+                    spec = json.loads(line)
+                except json.JSONDecodeError as e:
+                    rprint(f"[red]Error:[/red] line {lineno}: {e}")
+                    raise typer.Exit(1)
+                if not isinstance(spec, dict) or "project" not in spec or "description" not in spec:
+                    rprint(f"[red]Error:[/red] line {lineno}: needs \"project\" and \"description\"")
+                    raise typer.Exit(1)
+                specs.append(spec)
+        try:
+            tasks = _task_queue().create_many(specs)
+        except ValidationError as e:
+            rprint(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+        rprint(f"[green]✓[/green] Created {len(tasks)} tasks")
+        return
+    
+    if not project or not description:
+        rprint("[red]Error:[/red] Give a project and description, or --from-file")
+        raise typer.Exit(1)
+    
+    queue = _task_queue()
     
     try:
         prio = TaskPriority(priority)
@@ -1907,11 +2431,7 @@ def queue_cancel(
     task_id: Annotated[str, typer.Argument(help="Task ID")],
 ):
     """Cancel a task."""
-    from .server.queue import TaskQueue
-    from .server.config import ensure_adt_home
-    
-    ensure_adt_home()
-    queue = TaskQueue()
+    queue = _task_queue()
     
     task = queue.cancel(task_id)
     if task:
@@ -1923,11 +2443,8 @@ def queue_cancel(
 @queue_app.command("stats")
 def queue_stats():
     """Show queue statistics."""
-    from .server.queue import TaskQueue
-    from .server.config import ensure_adt_home
-    
-    ensure_adt_home()
-    queue = TaskQueue()
+    from rich.panel import Panel
+    queue = _task_queue()
     stats = queue.stats()
     
     rprint(Panel(
@@ -1944,5 +2461,80 @@ def queue_stats():
     ))
 
 
+@queue_app.command("maintenance")
+def queue_maintenance():
+    """Analyze and vacuum the server's task database."""
+    from .server.config import ensure_adt_home
+    from .server.db import init_databases, close_databases
+    from .server.db.connection import get_db_manager
+    
+    ensure_adt_home()
+    init_databases()
+    manager = get_db_manager()
+    db_path = manager.db_dir / "tasks.db"
+    try:
+        manager.maintain("tasks")
+    finally:
+        close_databases()
+    
+    rprint(f"[green]✓[/green] Analyzed and vacuumed {db_path} "
+           f"({db_path.stat().st_size // 1024} KiB)")
+
+
+# =============================================================================
+# Entry Point
+# =============================================================================
+
+_SUBCOMMAND_GROUPS = {
+    "run": run_app,
+    "skill": skills_app,
+    "tool": tools_app,
+    "server": server_app,
+    "config": config_app,
+    "token": token_app,
+    "agent": agent_app,
+    "queue": queue_app,
+}
+
+
+def _sniff_subcommand(argv: list[str]) -> str | None:
+    """Get the command name from argv, or None for top-level options/help."""
+    if len(argv) < 2 or argv[1].startswith("-"):
+        return None
+    return argv[1]
+
+
+def _build_app(argv: list[str]) -> typer.Typer:
+    """Register the subcommand groups needed for this invocation.
+    
+    Typer builds a Click parser for every registered group on each run, so
+    only the group being invoked is added. Top-level help, shell completion
+    and unknown commands still get every group so listings and errors stay
+    complete.
+    """
+    registered = {g.name for g in app.registered_groups}
+    top_level = {
+        c.name or c.callback.__name__.replace("_", "-") for c in app.registered_commands
+    }
+    
+    name = _sniff_subcommand(argv)
+    if name in _SUBCOMMAND_GROUPS and "_ADT_COMPLETE" not in os.environ:
+        wanted = [name]
+    elif name in top_level and "_ADT_COMPLETE" not in os.environ:
+        wanted = []
+    else:
+        wanted = list(_SUBCOMMAND_GROUPS)
+    
+    for group_name in wanted:
+        if group_name not in registered:
+            app.add_typer(_SUBCOMMAND_GROUPS[group_name], name=group_name)
+    return app
+
+
+def main() -> None:
+    """Entry point for the `adt` command."""
+    _build_app(sys.argv)()
+
+
 if __name__ == "__main__":
-    app()
+    main()
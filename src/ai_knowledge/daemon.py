@@ -0,0 +1,206 @@
+"""Persistent CLI daemon: run `adt` commands in one long-lived process.
+
+`adt daemon` listens on a Unix socket in the ADT home directory. The `adtc`
+client forwards its argv and working directory there and relays the output,
+so scripted calls skip interpreter startup and repeated imports. When no
+daemon is listening, `adtc` runs the command in-process like `adt`.
+
+This module only uses the standard library so that `adtc` starts quickly.
+"""
+
+import io
+import json
+import os
+import shutil
+import socket
+import struct
+import sys
+import traceback
+from collections.abc import Callable
+from pathlib import Path
+
+SOCKET_NAME = "cli.sock"
+
+# Frame header: one tag byte and the payload length
+_HEADER = struct.Struct(">cI")
+_STDOUT, _STDERR, _EXIT = b"1", b"2", b"x"
+
+# Commands that prompt, open an editor or run until interrupted need the
+# caller's terminal, so adtc always runs them in-process.
+_LOCAL_ONLY = (
+    ("daemon",),
+    ("watch",),
+    ("init",),
+    ("learn",),
+    ("server", "start"),
+    ("config", "edit"),
+    ("config", "set-secret"),
+    ("token", "delete"),
+    ("agent", "logs"),
+)
+
+
+def get_socket_path() -> Path:
+    """Path of the daemon socket (under $ADT_HOME, default ~/.adt)."""
+    return Path(os.environ.get("ADT_HOME", Path.home() / ".adt")) / SOCKET_NAME
+
+
+def _is_local_only(args: list[str]) -> bool:
+    if "-" in args:
+        return True  # reads the caller's stdin, which isn't forwarded
+    words = [a for a in args if not a.startswith("-")]
+    return any(tuple(words[:len(prefix)]) == prefix for prefix in _LOCAL_ONLY)
+
+
+def _send_frame(conn: socket.socket, tag: bytes, payload: bytes) -> None:
+    conn.sendall(_HEADER.pack(tag, len(payload)) + payload)
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    data = bytearray()
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("daemon closed the connection")
+        data += chunk
+    return bytes(data)
+
+
+class _FrameWriter(io.RawIOBase):
+    """Binary stream that sends everything written to it as frames of one tag."""
+    
+    def __init__(self, conn: socket.socket, tag: bytes):
+        self._conn = conn
+        self._tag = tag
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data) -> int:
+        _send_frame(self._conn, self._tag, bytes(data))
+        return len(data)
+
+
+def _text_stream(conn: socket.socket, tag: bytes) -> io.TextIOWrapper:
+    return io.TextIOWrapper(
+        io.BufferedWriter(_FrameWriter(conn, tag)),
+        encoding="utf-8",
+        errors="replace",
+        line_buffering=True,
+    )
+
+
+def serve(run: Callable[[list[str], dict], int]) -> None:
+    """Accept client connections until interrupted, one command at a time.
+    
+    run(argv, request) executes a command with sys.stdout/sys.stderr already
+    redirected to the client and returns its exit code.
+    """
+    path = get_socket_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    if path.exists():
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                probe.connect(str(path))
+        except OSError:
+            path.unlink()  # left behind by a daemon that didn't shut down cleanly
+        else:
+            raise RuntimeError(f"A daemon is already listening on {path}")
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)  # socket is only usable by its owner
+    try:
+        server.bind(str(path))
+    finally:
+        os.umask(old_umask)
+    server.listen()
+    
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                _handle(conn, run)
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+
+
+def _handle(conn: socket.socket, run: Callable[[list[str], dict], int]) -> None:
+    with conn.makefile("rb") as reader:
+        line = reader.readline()
+    try:
+        request = json.loads(line)
+        argv = [str(a) for a in request["argv"]]
+    except (ValueError, KeyError, TypeError):
+        return
+    
+    saved = sys.argv, sys.stdin, sys.stdout, sys.stderr, os.getcwd()
+    out, err = _text_stream(conn, _STDOUT), _text_stream(conn, _STDERR)
+    code = 1
+    try:
+        os.chdir(request.get("cwd") or saved[4])
+        # The client's stdin isn't forwarded: a command that prompts anyway
+        # sees end-of-input and aborts instead of reading the daemon's own.
+        sys.argv, sys.stdin, sys.stdout, sys.stderr = argv, io.StringIO(), out, err
+        code = run(argv, request)
+    except BrokenPipeError:
+        return  # client went away
+    except Exception:
+        traceback.print_exc()
+    finally:
+        for stream in (out, err):
+            try:
+                stream.flush()
+            except OSError:
+                pass
+        sys.argv, sys.stdin, sys.stdout, sys.stderr = saved[:4]
+        os.chdir(saved[4])
+    try:
+        _send_frame(conn, _EXIT, str(code).encode())
+    except OSError:
+        pass
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run argv on the daemon and relay its output; None if no daemon is listening."""
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "tty": sys.stdout.isatty(),
+        "columns": shutil.get_terminal_size().columns,
+    }
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(str(get_socket_path()))
+    except OSError:
+        conn.close()
+        return None
+    
+    streams = {_STDOUT: sys.stdout.buffer, _STDERR: sys.stderr.buffer}
+    with conn:
+        conn.sendall(json.dumps(request).encode() + b"\n")
+        while True:
+            tag, size = _HEADER.unpack(_recv_exact(conn, _HEADER.size))
+            payload = _recv_exact(conn, size)
+            if tag == _EXIT:
+                return int(payload)
+            stream = streams[tag]
+            stream.write(payload)
+            stream.flush()
+
+
+def main() -> None:
+    """Entry point for the `adtc` command."""
+    if not _is_local_only(sys.argv[1:]):
+        try:
+            code = forward(sys.argv)
+        except ConnectionError:
+            code = 1
+        if code is not None:
+            sys.exit(code)
+    
+    from .cli import main as cli_main
+    cli_main()
@@ -1,39 +1,74 @@
 """Index generation from .ai/ directories and markdown files."""
 
 import hashlib
+import os
+import pickle
 import re
 from datetime import datetime
 from pathlib import Path
 
+from . import __version__
 from .models import GlobalConfig, KnowledgeNode, LearningEntry, NodeType, ProjectConfig
 
+_SECTION_HEADING = re.compile(r"^## (.*)$", re.MULTILINE)
+# Learning entry headers with format: ### YYYY-MM-DD: Title
+_LEARNING_HEADER = re.compile(r"^###\s+(\d{4}-\d{2}-\d{2}):[ \t]*(.+)$", re.MULTILINE)
+_MARKDOWN_CHARS = str.maketrans("", "", "#*`[]")
+
+# Summarized sections per markdown file, keyed by path and validated
+# against (st_mtime_ns, st_size); persisted to SECTIONS_CACHE_FILE.
+_section_cache: dict[str, tuple[tuple[int, int], list[tuple[str, int, int, str]]]] | None = None
+_section_cache_used: set[str] = set()
+_section_cache_dirty = False
+
 
 def generate_id(content: str) -> str:
     """Generate a short stable ID from content."""
-    return hashlib.sha256(content.encode()).hexdigest()[:8]
+    return hashlib.blake2b(content.encode(), digest_size=4).hexdigest()
 
 
 def parse_learning_entries(content: str, project: str | None = None) -> list[LearningEntry]:
-    """Parse learning entries from a learnings.md file."""
-    entries = []
+    """Parse learning entries from a learnings.md file.
     
-    # Match entries with format: ### YYYY-MM-DD: Title
-    entry_pattern = re.compile(
-        r"###\s+(\d{4}-\d{2}-\d{2}):\s*(.+?)\n"
-        r".*?\*\*Issue:\*\*\s*(.+?)\n"
-        r".*?\*\*Correction:\*\*\s*(.+?)(?:\n.*?\*\*Context:\*\*\s*(.+?))?(?=\n###|\n---|\Z)",
-        re.DOTALL
-    )
+    Each entry runs from its "### date: title" header to the next header
+    (or a "---" rule) and needs **Issue:** and **Correction:** fields;
+    **Context:** is optional.
+    """
+    entries = []
+    headers = list(_LEARNING_HEADER.finditer(content))
     
-    for match in entry_pattern.finditer(content):
-        date_str, title, issue, correction, context = match.groups()
+    for i, header in enumerate(headers):
+        end = headers[i + 1].start() if i + 1 < len(headers) else len(content)
+        body = content[header.end():end]
+        rule = body.find("\n---")
+        if rule != -1:
+            body = body[:rule]
+        
+        issue_at = body.find("**Issue:**")
+        correction_at = body.find("**Correction:**", issue_at + 1) if issue_at != -1 else -1
+        if correction_at == -1:
+            continue
+        
+        issue = body[issue_at + len("**Issue:**"):correction_at].lstrip()
+        newline = issue.find("\n")
+        if newline != -1:
+            issue = issue[:newline]
+        
+        correction = body[correction_at + len("**Correction:**"):]
+        context = None
+        context_at = correction.find("**Context:**")
+        if context_at != -1:
+            context = correction[context_at + len("**Context:**"):].strip() or None
+            correction = correction[:context_at]
+        
+        date_str, title = header.groups()
         entries.append(LearningEntry(
             id=generate_id(f"{date_str}{title}"),
             date=datetime.strptime(date_str, "%Y-%m-%d"),
             title=title.strip(),
             issue=issue.strip(),
             correction=correction.strip(),
-            context=context.strip() if context else None,
+            context=context,
             project=project,
         ))
     
@@ -42,69 +77,133 @@ def parse_learning_entries(content: str, project: str | None = None) -> list[Lea
 
 def parse_markdown_sections(file_path: Path) -> list[tuple[str, int, int, str]]:
     """Parse markdown file into sections. Returns [(title, start_line, end_line, content)]."""
-    content = file_path.read_text()
-    lines = content.split("\n")
+    # One UTF-8 decode, skipping the locale lookup and newline translation
+    # of read_text; "## " headings and line counts only look at "\n".
+    content = file_path.read_bytes().decode("utf-8", "replace")
+    headings = list(_SECTION_HEADING.finditer(content))
     sections = []
     
-    current_title = None
-    current_start = 0
-    current_lines = []
-    
-    for i, line in enumerate(lines):
-        if line.startswith("## "):
-            if current_title:
-                sections.append((
-                    current_title,
-                    current_start,
-                    i - 1,
-                    "\n".join(current_lines)
-                ))
-            current_title = line[3:].strip()
-            current_start = i
-            current_lines = []
+    # Line numbers are counted incrementally between consecutive headings
+    line = 0
+    pos = 0
+    starts = []
+    for match in headings:
+        line += content.count("\n", pos, match.start())
+        pos = match.start()
+        starts.append(line)
+    
+    for i, match in enumerate(headings):
+        if i + 1 < len(headings):
+            end_line = starts[i + 1] - 1
+            body = content[match.end() + 1:headings[i + 1].start() - 1]
         else:
-            current_lines.append(line)
-    
-    if current_title:
-        sections.append((
-            current_title,
-            current_start,
-            len(lines) - 1,
-            "\n".join(current_lines)
-        ))
+            end_line = line + content.count("\n", pos)
+            body = content[match.end() + 1:]
+        title = match.group(1).strip()
+        if title:  # an empty heading still ends the previous section
+            sections.append((title, starts[i], end_line, body))
     
     return sections
 
 
 def summarize_section(content: str, max_length: int = 150) -> str:
     """Generate a brief summary of section content."""
-    # Remove markdown formatting
-    clean = re.sub(r"[#*`\[\]]", "", content)
-    clean = re.sub(r"\n+", " ", clean).strip()
+    # Remove markdown formatting and join the lines; dropping empty lines
+    # turns each run of newlines into a single space
+    clean = " ".join(filter(None, content.translate(_MARKDOWN_CHARS).split("\n"))).strip()
     
     if len(clean) <= max_length:
         return clean
     return clean[:max_length].rsplit(" ", 1)[0] + "..."
 
 
+def _load_section_cache() -> dict:
+    global _section_cache
+    if _section_cache is None:
+        from .store import DEFAULT_CONFIG_DIR, SECTIONS_CACHE_FILE, SECTIONS_CACHE_VERSION
+        
+        try:
+            header, cache = pickle.loads((DEFAULT_CONFIG_DIR / SECTIONS_CACHE_FILE).read_bytes())
+            _section_cache = cache if header == (SECTIONS_CACHE_VERSION, __version__) else {}
+        except Exception:
+            _section_cache = {}  # missing, stale format or unreadable
+    return _section_cache
+
+
+def _save_section_cache(prune: bool = False) -> None:
+    """Persist the section cache; prune drops files not seen since the last prune."""
+    global _section_cache_dirty
+    if _section_cache is None:
+        return
+    if prune:
+        for key in _section_cache.keys() - _section_cache_used:
+            del _section_cache[key]
+            _section_cache_dirty = True
+        _section_cache_used.clear()
+    if not _section_cache_dirty:
+        return
+    
+    from .store import DEFAULT_CONFIG_DIR, SECTIONS_CACHE_FILE, SECTIONS_CACHE_VERSION, write_atomic
+    
+    try:
+        DEFAULT_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+        write_atomic(
+            DEFAULT_CONFIG_DIR / SECTIONS_CACHE_FILE,
+            pickle.dumps(((SECTIONS_CACHE_VERSION, __version__), _section_cache), protocol=5),
+        )
+        _section_cache_dirty = False
+    except OSError:
+        pass  # caching is best-effort
+
+
+def _document_sections(file_path: Path) -> list[tuple[str, int, int, str]]:
+    """Summarized sections of a markdown file: [(title, start_line, end_line, summary)].
+    
+    Reuses the cached result while the file's mtime and size are unchanged.
+    """
+    global _section_cache_dirty
+    cache = _load_section_cache()
+    key = str(file_path)
+    stat = file_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    _section_cache_used.add(key)
+    
+    cached = cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    sections = [
+        (title, start, end, summarize_section(content))
+        for title, start, end, content in parse_markdown_sections(file_path)
+    ]
+    cache[key] = (stamp, sections)
+    _section_cache_dirty = True
+    return sections
+
+
 def build_document_node(file_path: Path, parent_id: str) -> KnowledgeNode:
     """Build a document node with section children from a markdown file."""
     file_id = generate_id(str(file_path))
     doc_name = file_path.stem.replace("_", " ").title()
     
-    sections = parse_markdown_sections(file_path)
+    sections = _document_sections(file_path)
     children = []
     
-    for title, start, end, content in sections:
+    # Sections are the bulk of the tree. Their fields are already the right
+    # types, so skip validation, and let siblings share one timestamp.
+    now = datetime.now()
+    for title, start, end, summary in sections:
         section_id = f"{file_id}_{generate_id(title)}"
-        children.append(KnowledgeNode(
+        children.append(KnowledgeNode.model_construct(
             id=section_id,
             name=title,
             node_type=NodeType.SECTION,
-            summary=summarize_section(content),
+            summary=summary,
             file_path=file_path,
             start_line=start,
             end_line=end,
+            created_at=now,
+            updated_at=now,
         ))
     
     return KnowledgeNode(
@@ -114,9 +213,45 @@ def build_document_node(file_path: Path, parent_id: str) -> KnowledgeNode:
         file_path=file_path,
         summary=f"Contains {len(sections)} sections" if sections else None,
         children=children,
+        created_at=now,
+        updated_at=now,
     )
 
 
+def reindex_file(root: KnowledgeNode, file_path: Path) -> bool:
+    """Re-parse one markdown file and swap its document node into the tree.
+    
+    Returns False if the file has no document node in the index, in which
+    case the caller should fall back to build_full_index.
+    """
+    stack: list[tuple[KnowledgeNode, tuple[KnowledgeNode, ...]]] = [(root, ())]
+    while stack:
+        node, ancestors = stack.pop()
+        for i, child in enumerate(node.children):
+            if child.node_type == NodeType.DOCUMENT and child.file_path == file_path:
+                node.children[i] = build_document_node(file_path, node.id)
+                for changed in (*ancestors, node):
+                    changed.clear_caches()
+                _save_section_cache()
+                return True
+            stack.append((child, (*ancestors, node)))
+    return False
+
+
+def list_markdown(directory: Path) -> list[Path]:
+    """Markdown files directly in a directory, sorted by name (like sorted(glob("*.md")))."""
+    try:
+        with os.scandir(directory) as it:
+            names = [
+                e.name for e in it
+                if e.name.endswith(".md") and not e.name.startswith(".") and e.is_file()
+            ]
+    except OSError:
+        return []
+    names.sort()
+    return [directory / name for name in names]
+
+
 def build_project_node(project: ProjectConfig) -> KnowledgeNode:
     """Build a project node from a project configuration."""
     from .skills import load_skills_from_dir, build_skills_node
@@ -124,9 +259,8 @@ def build_project_node(project: ProjectConfig) -> KnowledgeNode:
     ai_path = project.full_ai_path
     children = []
     
-    if ai_path.exists():
-        for md_file in sorted(ai_path.glob("*.md")):
-            children.append(build_document_node(md_file, project.name))
+    for md_file in list_markdown(ai_path):
+        children.append(build_document_node(md_file, project.name))
     
     # Add project skills
     skills = load_skills_from_dir(project.skills_path, project.name)
@@ -175,9 +309,8 @@ def build_global_node(global_ai_dir: Path, config: GlobalConfig) -> KnowledgeNod
     
     children = []
     
-    if global_ai_dir.exists():
-        for md_file in sorted(global_ai_dir.glob("*.md")):
-            children.append(build_document_node(md_file, "global"))
+    for md_file in list_markdown(global_ai_dir):
+        children.append(build_document_node(md_file, "global"))
     
     # Add global skills
     skills = load_skills_from_dir(config.global_skills_path, "global")
@@ -204,10 +337,21 @@ def build_global_node(global_ai_dir: Path, config: GlobalConfig) -> KnowledgeNod
 
 
 def build_full_index(config: GlobalConfig) -> KnowledgeNode:
-    """Build the complete knowledge index tree."""
+    """Build the complete knowledge index tree.
+    
+    Projects are built on a thread pool when there are many: reading their
+    .ai/ files and skill directories is mostly filesystem latency, and
+    parsing is cheap once the section cache is warm.
+    """
+    _load_section_cache()  # load once before worker threads share it
     global_node = build_global_node(config.global_ai_dir, config)
     
-    project_nodes = [build_project_node(p) for p in config.projects]
+    if len(config.projects) <= 4:
+        project_nodes = [build_project_node(p) for p in config.projects]
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(config.projects))) as pool:
+            project_nodes = list(pool.map(build_project_node, config.projects))
     
     projects_category = KnowledgeNode(
         id="projects",
@@ -217,6 +361,8 @@ def build_full_index(config: GlobalConfig) -> KnowledgeNode:
         children=project_nodes,
     )
     
+    _save_section_cache(prune=True)
+    
     return KnowledgeNode(
         id="root",
         name="AI Knowledge Base",
@@ -0,0 +1,49 @@
+"""JSON encoding for command output, using orjson when it is installed."""
+
+import json
+from datetime import date, datetime, time
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional: pip install agent-dev-tool[fast]
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    # Encode these the way orjson does natively, so the stdlib path gives
+    # the same text whether or not orjson is installed
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize to indented JSON text; values JSON can't encode fall back to str().
+    
+    Output is the same with or without orjson: UTF-8 text is left
+    unescaped and dates are ISO 8601.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj,
+                default=_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; the stdlib handles those
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text; input orjson rejects (e.g. NaN) goes to the stdlib parser."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # the stdlib either accepts it or raises the usual error
+    return json.loads(data)
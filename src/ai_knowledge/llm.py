@@ -1,8 +1,16 @@
 """LLM integration for intelligent features."""
 
+import copy
+import http.client
 import json
-import subprocess
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
+from urllib.parse import urlsplit
 
 
 @dataclass
@@ -13,80 +21,212 @@ class LLMConfig:
 
 
 # Constrained valid values for project configuration
-VALID_TYPES = {"backend", "frontend", "fullstack"}
-VALID_BACKENDS = {"fastapi", "express", "django", "none"}
-VALID_FRONTENDS = {"react", "vue", "nextjs", "none"}
-VALID_DATABASES = {"postgres", "mongodb", "sqlite", "none"}
-VALID_DEPLOYMENTS = {"docker", "render", "vercel", "aws", "none"}
-VALID_FEATURES = {
+VALID_TYPES = frozenset({"backend", "frontend", "fullstack"})
+VALID_BACKENDS = frozenset({"fastapi", "express", "django", "none"})
+VALID_FRONTENDS = frozenset({"react", "vue", "nextjs", "none"})
+VALID_DATABASES = frozenset({"postgres", "mongodb", "sqlite", "none"})
+VALID_DEPLOYMENTS = frozenset({"docker", "render", "vercel", "aws", "none"})
+VALID_FEATURES = frozenset({
     "auth", "pdf", "email", "file-upload", "payments", "search",
     "websocket", "caching", "notifications", "analytics", "admin",
     "api", "graphql", "queue", "scheduler", "storage"
-}
+})
+_FEATURES_LIST = ", ".join(sorted(VALID_FEATURES))
 
 # Keywords that map to features (for validation/fallback)
 FEATURE_KEYWORDS = {
-    "auth": ["auth", "login", "user", "sso", "oauth", "jwt", "session", "password"],
-    "pdf": ["pdf", "document", "report", "invoice", "generate", "export"],
-    "email": ["email", "mail", "notification", "send", "smtp"],
-    "file-upload": ["upload", "file", "storage", "s3", "attachment", "image"],
-    "payments": ["payment", "stripe", "billing", "subscription", "checkout"],
-    "search": ["search", "elasticsearch", "filter", "query", "find"],
-    "websocket": ["realtime", "websocket", "live", "chat", "stream", "real-time"],
-    "caching": ["cache", "redis", "memcache", "fast"],
-    "notifications": ["notification", "push", "alert"],
-    "analytics": ["analytics", "metrics", "dashboard", "monitor", "tracking"],
-    "admin": ["admin", "backoffice", "management", "cms"],
-    "queue": ["queue", "worker", "background", "celery", "job"],
-    "scheduler": ["schedule", "cron", "periodic", "timer"],
-    "storage": ["storage", "blob", "s3", "bucket", "cdn"],
+    "auth": ("auth", "login", "user", "sso", "oauth", "jwt", "session", "password"),
+    "pdf": ("pdf", "document", "report", "invoice", "generate", "export"),
+    "email": ("email", "mail", "notification", "send", "smtp"),
+    "file-upload": ("upload", "file", "storage", "s3", "attachment", "image"),
+    "payments": ("payment", "stripe", "billing", "subscription", "checkout"),
+    "search": ("search", "elasticsearch", "filter", "query", "find"),
+    "websocket": ("realtime", "websocket", "live", "chat", "stream", "real-time"),
+    "caching": ("cache", "redis", "memcache", "fast"),
+    "notifications": ("notification", "push", "alert"),
+    "analytics": ("analytics", "metrics", "dashboard", "monitor", "tracking"),
+    "admin": ("admin", "backoffice", "management", "cms"),
+    "queue": ("queue", "worker", "background", "celery", "job"),
+    "scheduler": ("schedule", "cron", "periodic", "timer"),
+    "storage": ("storage", "blob", "s3", "bucket", "cdn"),
+}
+
+def _keyword_scanner(table: dict[str, tuple[str, ...]]) -> Callable[[str], set[str]]:
+    """Build a matcher returning the labels whose keywords occur in a text, in one scan.
+    
+    The lookahead alternation tries the longest keyword first at every
+    position, so each keyword also carries the labels of the keywords it
+    starts with; the result equals testing every keyword with `in`.
+    """
+    keyword_labels = {
+        kw: frozenset(label for label, keywords in table.items() if any(kw.startswith(k) for k in keywords))
+        for keywords in table.values()
+        for kw in keywords
+    }
+    pattern = re.compile(
+        "(?=(" + "|".join(map(re.escape, sorted(keyword_labels, key=len, reverse=True))) + "))"
+    )
+    
+    def scan(text: str) -> set[str]:
+        found = set()
+        for match in pattern.finditer(text):
+            found |= keyword_labels[match.group(1)]
+        return found
+    
+    return scan
+
+
+# Features whose keywords occur in a lowercased description
+_detect_features = _keyword_scanner(FEATURE_KEYWORDS)
+
+# Keyword cues for analyze_with_heuristics, matched in a single pass
+_HEURISTIC_FEATURES = {
+    "auth": ("auth", "login", "user", "sso", "oauth"),
+    "file-upload": ("upload", "file", "storage", "s3", "attachment"),
+    "pdf": ("pdf", "document", "report", "invoice"),
+    "email": ("email", "notification", "mail"),
+    "payments": ("payment", "stripe", "billing", "subscription"),
+    "search": ("search", "elasticsearch", "filter"),
+    "websocket": ("realtime", "websocket", "live", "chat"),
+    "caching": ("cache", "redis"),
 }
+_heuristic_cues = _keyword_scanner({
+    "type:backend": ("api", "rest", "backend", "server", "database", "crud"),
+    "type:frontend": ("ui", "frontend", "dashboard", "interface", "web app", "webapp"),
+    "backend:fastapi": ("python", "fastapi", "pdf", "ml", "ai", "data"),
+    "backend:express": ("node", "express", "javascript", "typescript"),
+    "backend:django": ("django", "admin"),
+    "frontend:nextjs": ("next", "nextjs", "ssr"),
+    "frontend:vue": ("vue",),
+    "database:postgres": ("postgres", "postgresql", "relational", "sql"),
+    "database:mongodb": ("mongo", "nosql", "document"),
+    "database:any": ("database", "store", "persist", "crud"),
+    **{f"feature:{feature}": keywords for feature, keywords in _HEURISTIC_FEATURES.items()},
+})
+
+
+# Ollama's HTTP API; OLLAMA_HOST overrides it the same way it does for the CLI
+OLLAMA_DEFAULT_HOST = "127.0.0.1:11434"
+OLLAMA_TIMEOUT = 60  # seconds
+
+_ollama_local = threading.local()
+
+
+def _ollama_connection() -> http.client.HTTPConnection:
+    """Keep-alive connection to the Ollama API, one per thread."""
+    conn = getattr(_ollama_local, "conn", None)
+    if conn is None:
+        host = os.environ.get("OLLAMA_HOST") or OLLAMA_DEFAULT_HOST
+        url = urlsplit(host if "://" in host else f"http://{host}")
+        conn = http.client.HTTPConnection(url.hostname or "127.0.0.1", url.port or 11434, timeout=OLLAMA_TIMEOUT)
+        _ollama_local.conn = conn
+    return conn
+
+
+def _ollama_request(
+    method: str, path: str, payload: dict | None = None, timeout: float = OLLAMA_TIMEOUT
+) -> dict | None:
+    """Call the Ollama API and decode the JSON reply; None if it's unreachable."""
+    body = json.dumps(payload).encode() if payload is not None else None
+    headers = {"Content-Type": "application/json"} if body is not None else {}
+    for attempt in range(2):
+        conn = _ollama_connection()
+        reused = conn.sock is not None
+        conn.timeout = timeout
+        if reused:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request(method, path, body, headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            if reused and attempt == 0:
+                continue  # the server dropped an idle keep-alive connection
+            return None
+        if response.status != 200:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+    return None
 
 
 def ollama_generate(prompt: str, model: str = "llama3.2:3b", format_json: bool = False) -> str | dict | None:
     """Generate text using Ollama."""
-    try:
-        cmd = ["ollama", "run", model]
-        if format_json:
-            cmd.extend(["--format", "json"])
-        
-        result = subprocess.run(
-            cmd,
-            input=prompt,
-            capture_output=True,
-            text=True,
-            timeout=60,
-        )
-        
-        if result.returncode != 0:
-            return None
-        
-        output = result.stdout.strip()
-        
-        if format_json:
-            try:
-                return json.loads(output)
-            except json.JSONDecodeError:
-                # Try to extract JSON from the output
-                start = output.find("{")
-                end = output.rfind("}") + 1
-                if start >= 0 and end > start:
-                    return json.loads(output[start:end])
-                return None
-        
-        return output
-    except subprocess.TimeoutExpired:
-        return None
-    except FileNotFoundError:
+    payload = {"model": model, "prompt": prompt, "stream": False}
+    if format_json:
+        payload["format"] = "json"
+    
+    reply = _ollama_request("POST", "/api/generate", payload)
+    if not isinstance(reply, dict) or not isinstance(reply.get("response"), str):
         return None
+    
+    output = reply["response"].strip()
+    
+    if format_json:
+        try:
+            return json.loads(output)
+        except json.JSONDecodeError:
+            # Try to extract JSON from the output
+            start = output.find("{")
+            end = output.rfind("}") + 1
+            if start >= 0 and end > start:
+                try:
+                    return json.loads(output[start:end])
+                except json.JSONDecodeError:
+                    return None
+            return None
+    
+    return output
+
+
+def ollama_generate_many(
+    prompts: list[str], model: str = "llama3.2:3b", format_json: bool = False, max_workers: int = 4
+) -> list[str | dict | None]:
+    """Generate for several prompts concurrently, results in prompt order.
+    
+    Each worker thread keeps its own connection, so requests are pipelined
+    to the Ollama server instead of waiting on one another client-side.
+    """
+    if len(prompts) <= 1:
+        return [ollama_generate(p, model, format_json) for p in prompts]
+    
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(prompts))) as pool:
+        return list(pool.map(lambda p: ollama_generate(p, model, format_json), prompts))
 
 
-def analyze_project_description(description: str) -> dict:
-    """Use LLM to analyze a project description and suggest configuration."""
+def analyze_project_description(description: str, model: str = "llama3.2:3b") -> dict:
+    """Use LLM to analyze a project description and suggest configuration.
     
-    # List valid options explicitly in prompt
-    features_list = ", ".join(sorted(VALID_FEATURES))
+    LLM results are memoized per (description, model) for the life of the
+    process; callers get their own copy to modify. The heuristic fallback
+    isn't cached, so the LLM is tried again on the next call.
+    """
+    try:
+        return copy.deepcopy(_analyze_cached(description, model))
+    except _NoAnalysis:
+        pass
+    
+    # Fallback to heuristics if LLM fails
+    fallback = analyze_with_heuristics(description)
+    
+    # Try to extract name even in fallback
+    extracted = extract_project_name(description)
+    if extracted:
+        fallback["suggested_name"] = extracted
     
+    return fallback
+
+
+class _NoAnalysis(Exception):
+    """The LLM gave no usable analysis; raised so lru_cache doesn't keep it."""
+
+
+@lru_cache(maxsize=256)
+def _analyze_cached(description: str, model: str) -> dict:
     prompt = f"""Analyze this project description and suggest configuration.
 
 Description: "{description}"
@@ -107,10 +247,10 @@ Respond with ONLY valid JSON:
 
 Rules:
 - If the description mentions a project name (like "call it X" or "named X"), extract it as suggested_name in kebab-case
-- For "features", ONLY use values from: {features_list}
+- For "features", ONLY use values from: {_FEATURES_LIST}
 - If a feature is not mentioned, do not include it"""
 
-    result = ollama_generate(prompt, format_json=True)
+    result = ollama_generate(prompt, model=model, format_json=True)
     
     if result and isinstance(result, dict):
         result = validate_and_fix_config(result, description)
@@ -123,35 +263,27 @@ Rules:
         
         return result
     
-    # Fallback to heuristics if LLM fails
-    fallback = analyze_with_heuristics(description)
-    
-    # Try to extract name even in fallback
-    extracted = extract_project_name(description)
-    if extracted:
-        fallback["suggested_name"] = extracted
-    
-    return fallback
+    raise _NoAnalysis
+
+
+# Patterns that indicate a name is being given
+_NAME_PATTERNS = [
+    re.compile(r"(?:call it|called|named|name it|let's call it|let's name it)\s+['\"]?([a-z][a-z0-9-_]+)['\"]?"),
+    re.compile(r"([a-z][a-z0-9-]+(?:-[a-z0-9]+)+)\s+(?:is also|would be|could be)"),  # "foo-bar is also a good name"
+]
+_NAME_SEPARATORS = re.compile(r"[_\s]+")
 
 
 def extract_project_name(description: str) -> str | None:
     """Try to extract a project name from description using patterns."""
-    import re
-    
     desc_lower = description.lower()
     
-    # Patterns that indicate a name is being given
-    patterns = [
-        r"(?:call it|called|named|name it|let's call it|let's name it)\s+['\"]?([a-z][a-z0-9-_]+)['\"]?",
-        r"([a-z][a-z0-9-]+(?:-[a-z0-9]+)+)\s+(?:is also|would be|could be)",  # "foo-bar is also a good name"
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, desc_lower)
+    for pattern in _NAME_PATTERNS:
+        match = pattern.search(desc_lower)
         if match:
             name = match.group(1).strip("'\".,")
             # Convert to kebab-case if needed
-            name = re.sub(r'[_\s]+', '-', name)
+            name = _NAME_SEPARATORS.sub('-', name)
             return name
     
     return None
@@ -191,11 +323,7 @@ def validate_and_fix_config(config: dict, description: str) -> dict:
     valid_features = [f.lower() for f in llm_features if f.lower() in VALID_FEATURES]
     
     # Also detect features from description keywords (hybrid approach)
-    desc_lower = description.lower()
-    detected_features = set()
-    for feature, keywords in FEATURE_KEYWORDS.items():
-        if any(kw in desc_lower for kw in keywords):
-            detected_features.add(feature)
+    detected_features = _detect_features(description.lower())
     
     # Merge: LLM features that are valid + keyword-detected features
     # But prioritize keyword detection for accuracy
@@ -208,11 +336,11 @@ def validate_and_fix_config(config: dict, description: str) -> dict:
 
 def analyze_with_heuristics(description: str) -> dict:
     """Fallback heuristics when LLM is unavailable."""
-    desc_lower = description.lower()
+    cues = _heuristic_cues(description.lower())
     
     # Detect type
-    is_backend = any(w in desc_lower for w in ["api", "rest", "backend", "server", "database", "crud"])
-    is_frontend = any(w in desc_lower for w in ["ui", "frontend", "dashboard", "interface", "web app", "webapp"])
+    is_backend = "type:backend" in cues
+    is_frontend = "type:frontend" in cues
     
     if is_backend and is_frontend:
         proj_type = "fullstack"
@@ -224,11 +352,11 @@ def analyze_with_heuristics(description: str) -> dict:
     # Detect backend stack
     backend_stack = "none"
     if proj_type in ("backend", "fullstack"):
-        if any(w in desc_lower for w in ["python", "fastapi", "pdf", "ml", "ai", "data"]):
+        if "backend:fastapi" in cues:
             backend_stack = "fastapi"
-        elif any(w in desc_lower for w in ["node", "express", "javascript", "typescript"]):
+        elif "backend:express" in cues:
             backend_stack = "express"
-        elif any(w in desc_lower for w in ["django", "admin"]):
+        elif "backend:django" in cues:
             backend_stack = "django"
         else:
             backend_stack = "fastapi"  # default
@@ -236,38 +364,24 @@ def analyze_with_heuristics(description: str) -> dict:
     # Detect frontend stack
     frontend_stack = "none"
     if proj_type in ("frontend", "fullstack"):
-        if any(w in desc_lower for w in ["next", "nextjs", "ssr"]):
+        if "frontend:nextjs" in cues:
             frontend_stack = "nextjs"
-        elif any(w in desc_lower for w in ["vue"]):
+        elif "frontend:vue" in cues:
             frontend_stack = "vue"
         else:
             frontend_stack = "react"  # default
     
     # Detect database
     database = "none"
-    if any(w in desc_lower for w in ["postgres", "postgresql", "relational", "sql"]):
+    if "database:postgres" in cues:
         database = "postgres"
-    elif any(w in desc_lower for w in ["mongo", "nosql", "document"]):
+    elif "database:mongodb" in cues:
         database = "mongodb"
-    elif any(w in desc_lower for w in ["database", "store", "persist", "crud"]):
+    elif "database:any" in cues:
         database = "postgres"  # default
     
     # Detect features
-    features = []
-    feature_keywords = {
-        "auth": ["auth", "login", "user", "sso", "oauth"],
-        "file-upload": ["upload", "file", "storage", "s3", "attachment"],
-        "pdf": ["pdf", "document", "report", "invoice"],
-        "email": ["email", "notification", "mail"],
-        "payments": ["payment", "stripe", "billing", "subscription"],
-        "search": ["search", "elasticsearch", "filter"],
-        "websocket": ["realtime", "websocket", "live", "chat"],
-        "caching": ["cache", "redis"],
-    }
-    
-    for feature, keywords in feature_keywords.items():
-        if any(kw in desc_lower for kw in keywords):
-            features.append(feature)
+    features = [f for f in _HEURISTIC_FEATURES if f"feature:{f}" in cues]
     
     return {
         "type": proj_type,
@@ -282,15 +396,49 @@ def analyze_with_heuristics(description: str) -> dict:
     }
 
 
-def is_ollama_available() -> bool:
-    """Check if Ollama is running and available."""
+# Probe result shared across invocations; the probe can take up to its
+# timeout when the server is unreachable, and the answer rarely changes minute to minute.
+ENV_CACHE_FILE = "env-cache.json"
+ENV_CACHE_TTL = 300  # seconds
+
+# In-process copy of the probe result: (available, checked_at)
+_ollama_checked: tuple[bool, float] | None = None
+
+
+def is_ollama_available(refresh: bool = False) -> bool:
+    """Check if Ollama is running and available.
+    
+    The result is cached in memory and on disk for ENV_CACHE_TTL seconds;
+    pass refresh=True to probe again regardless.
+    """
+    global _ollama_checked
+    from .store import DEFAULT_CONFIG_DIR
+    
+    if not refresh and _ollama_checked is not None:
+        available, checked_at = _ollama_checked
+        if 0 <= time.time() - checked_at < ENV_CACHE_TTL:
+            return available
+    
+    cache_path = DEFAULT_CONFIG_DIR / ENV_CACHE_FILE
+    if not refresh:
+        try:
+            cached = json.loads(cache_path.read_text())
+            if 0 <= time.time() - cached["checked_at"] < ENV_CACHE_TTL:
+                _ollama_checked = (bool(cached["ollama_available"]), cached["checked_at"])
+                return _ollama_checked[0]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+    
+    available = _probe_ollama()
+    _ollama_checked = (available, time.time())
     try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True,
-            text=True,
-            timeout=5,
-        )
-        return result.returncode == 0
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        return False
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"ollama_available": available, "checked_at": time.time()}))
+    except OSError:
+        pass  # caching is best-effort
+    return available
+
+
+def _probe_ollama() -> bool:
+    # Ask the same server ollama_generate talks to, honouring OLLAMA_HOST
+    return isinstance(_ollama_request("GET", "/api/tags", timeout=5), dict)
@@ -1,6 +1,8 @@
 """MCP server implementation for agent-dev-tool."""
 
-import json
+import asyncio
+import os
+from functools import lru_cache
 from pathlib import Path
 
 from mcp.server import Server
@@ -16,9 +18,11 @@ from mcp.types import (
     ReadResourceResult,
 )
 
+from ..indexer import list_markdown
+from ..jsonutil import dumps
 from ..store import load_config, load_index
 from ..tools import load_all_tools
-from ..skills import load_all_skills
+from ..skills import SkillIndex, load_all_skills
 
 
 def create_server() -> Server:
@@ -26,6 +30,15 @@ def create_server() -> Server:
     server = Server("agent-dev-tool")
     config = load_config()
     
+    # MCP tool list for the registry it was built from; load_all_tools
+    # returns the same registry object until a tool file changes.
+    listed_tools: tuple[object, list[Tool]] | None = None
+    # Resource list, valid while the knowledge directories' mtimes (which
+    # change when files are added, removed or renamed) and the skills
+    # list from load_all_skills stay the same.
+    listed_resources: tuple[tuple[int, ...], list, list[Path], list[Resource]] | None = None
+    skill_index: SkillIndex | None = None
+    
     # =========================================================================
     # TOOLS - Expose all registered tools as MCP tools
     # =========================================================================
@@ -33,32 +46,16 @@ def create_server() -> Server:
     @server.list_tools()
     async def list_tools() -> ListToolsResult:
         """List all available tools."""
+        nonlocal listed_tools
         registry = load_all_tools(config)
-        tools = []
-        
-        for t in registry.list():
-            # Build input schema from tool params
-            properties = {}
-            required = []
-            
-            for p in t.params:
-                properties[p.name] = {
-                    "type": _python_type_to_json(p.type),
-                    "description": p.description or f"Parameter {p.name}",
-                }
-                if p.required:
-                    required.append(p.name)
-            
-            tools.append(Tool(
-                name=t.name,
-                description=t.description,
-                inputSchema={
-                    "type": "object",
-                    "properties": properties,
-                    "required": required,
-                },
-            ))
+        if listed_tools is not None and listed_tools[0] is registry:
+            return listed_tools[1]
+        tools = [
+            Tool(name=t.name, description=t.description, inputSchema=_input_schema(t))
+            for t in registry.list()
+        ]
         
+        listed_tools = (registry, tools)
         return tools
     
     @server.call_tool()
@@ -74,7 +71,7 @@ def create_server() -> Server:
             result = t(**arguments)
             
             if isinstance(result, (dict, list)):
-                text = json.dumps(result, indent=2, default=str)
+                text = dumps(result)
             else:
                 text = str(result)
             
@@ -89,21 +86,35 @@ def create_server() -> Server:
     @server.list_resources()
     async def list_resources() -> ListResourcesResult:
         """List all available resources."""
+        nonlocal listed_resources
+        doc_dirs = [config.global_ai_dir, *(p.full_ai_path for p in config.projects)]
+        dir_stamps = tuple(_dir_mtime_ns(d) for d in doc_dirs)
+        skills = load_all_skills(config)
+        
+        if (
+            listed_resources is not None
+            and listed_resources[0] == dir_stamps
+            and listed_resources[1] is skills
+        ):
+            doc_paths, resources = listed_resources[2], listed_resources[3]
+            asyncio.get_running_loop().run_in_executor(None, _prewarm_markdown, doc_paths)
+            return resources
+        
         resources = []
+        doc_paths = []
         
         # Global knowledge files
-        global_ai = config.global_ai_dir
-        if global_ai.exists():
-            for md_file in global_ai.glob("*.md"):
-                resources.append(Resource(
-                    uri=f"adt://global/{md_file.stem}",
-                    name=f"Global: {md_file.stem}",
-                    description=f"Global {md_file.stem} knowledge",
-                    mimeType="text/markdown",
-                ))
+        for md_file in list_markdown(config.global_ai_dir):
+            stem = md_file.name[:-3]
+            doc_paths.append(md_file)
+            resources.append(Resource(
+                uri=f"adt://global/{stem}",
+                name=f"Global: {stem}",
+                description=f"Global {stem} knowledge",
+                mimeType="text/markdown",
+            ))
         
         # Global skills
-        skills = load_all_skills(config)
         for skill in skills:
             trigger = f" ({skill.trigger})" if skill.trigger else ""
             resources.append(Resource(
@@ -115,15 +126,15 @@ def create_server() -> Server:
         
         # Project knowledge
         for project in config.projects:
-            ai_path = project.full_ai_path
-            if ai_path.exists():
-                for md_file in ai_path.glob("*.md"):
-                    resources.append(Resource(
-                        uri=f"adt://projects/{project.name}/{md_file.stem}",
-                        name=f"{project.name}: {md_file.stem}",
-                        description=f"Project {md_file.stem} for {project.name}",
-                        mimeType="text/markdown",
-                    ))
+            for md_file in list_markdown(project.full_ai_path):
+                stem = md_file.name[:-3]
+                doc_paths.append(md_file)
+                resources.append(Resource(
+                    uri=f"adt://projects/{project.name}/{stem}",
+                    name=f"{project.name}: {stem}",
+                    description=f"Project {stem} for {project.name}",
+                    mimeType="text/markdown",
+                ))
         
         # Knowledge index (ToC)
         resources.append(Resource(
@@ -141,77 +152,158 @@ def create_server() -> Server:
             mimeType="text/markdown",
         ))
         
+        # Clients usually read documents right after listing them; load them
+        # in the background so those reads are served from memory.
+        asyncio.get_running_loop().run_in_executor(None, _prewarm_markdown, doc_paths)
+        
+        listed_resources = (dir_stamps, skills, doc_paths, resources)
         return resources
     
+    async def read_global(name: str | None, _: str | None) -> list[TextContent] | None:
+        if name is None:
+            return None
+        text = await asyncio.to_thread(_read_markdown, config.global_ai_dir / f"{name}.md")
+        if text is not None:
+            return [TextContent(type="text", text=text)]
+        return [TextContent(type="text", text=f"File not found: {name}")]
+    
+    async def read_skill(skill_id: str | None, _: str | None) -> list[TextContent] | None:
+        nonlocal skill_index
+        if skill_id is None:
+            return None
+        skills = load_all_skills(config)
+        if skill_index is None or skill_index.skills is not skills:
+            skill_index = SkillIndex(skills)
+        skill = skill_index.get(skill_id)
+        if skill:
+            return [TextContent(type="text", text=skill.to_prompt())]
+        return [TextContent(type="text", text=f"Skill not found: {skill_id}")]
+    
+    async def read_project(project_name: str | None, file_name: str | None) -> list[TextContent] | None:
+        if file_name is None:
+            return None
+        project = config.get_project(project_name)
+        if project:
+            text = await asyncio.to_thread(_read_markdown, project.full_ai_path / f"{file_name}.md")
+            if text is not None:
+                return [TextContent(type="text", text=text)]
+        return [TextContent(type="text", text=f"Not found: {project_name}/{file_name}")]
+    
+    async def read_index(_: str | None, __: str | None) -> list[TextContent]:
+        index = load_index()
+        if index:
+            return [TextContent(type="text", text=index.to_toc())]
+        return [TextContent(type="text", text="Index not built. Run 'adt index' first.")]
+    
+    async def read_tool_docs(page: str | None, _: str | None) -> list[TextContent] | None:
+        if page != "docs":
+            return None
+        registry = load_all_tools(config)
+        return [TextContent(type="text", text=registry.to_prompt())]
+    
+    # Handlers for each adt://<category>, called with the URI's first and
+    # second path segments; None means the URI names none of its resources.
+    resource_handlers = {
+        "global": read_global,
+        "skills": read_skill,
+        "projects": read_project,
+        "index": read_index,
+        "tools": read_tool_docs,
+    }
+    
     @server.read_resource()
     async def read_resource(uri: str) -> ReadResourceResult:
         """Read a specific resource."""
-        parts = uri.replace("adt://", "").split("/")
-        
-        if not parts:
-            return [TextContent(type="text", text="Invalid URI")]
-        
-        category = parts[0]
-        
-        # Global knowledge
-        if category == "global" and len(parts) >= 2:
-            file_path = config.global_ai_dir / f"{parts[1]}.md"
-            if file_path.exists():
-                return [TextContent(type="text", text=file_path.read_text())]
-            return [TextContent(type="text", text=f"File not found: {parts[1]}")]
-        
-        # Skills
-        if category == "skills" and len(parts) >= 2:
-            skill_id = parts[1]
-            skills = load_all_skills(config)
-            skill = next((s for s in skills if s.id == skill_id), None)
-            if skill:
-                return [TextContent(type="text", text=skill.to_prompt())]
-            return [TextContent(type="text", text=f"Skill not found: {skill_id}")]
-        
-        # Project knowledge
-        if category == "projects" and len(parts) >= 3:
-            project_name = parts[1]
-            file_name = parts[2]
-            project = config.get_project(project_name)
-            if project:
-                file_path = project.full_ai_path / f"{file_name}.md"
-                if file_path.exists():
-                    return [TextContent(type="text", text=file_path.read_text())]
-            return [TextContent(type="text", text=f"Not found: {project_name}/{file_name}")]
+        # adt://<category>[/<first>[/<second>]]; absent segments are None
+        category, has_first, rest = uri.removeprefix("adt://").partition("/")
+        first, has_second, rest = rest.partition("/")
+        second = rest.partition("/")[0]
         
-        # Knowledge index
-        if category == "index":
-            index = load_index()
-            if index:
-                return [TextContent(type="text", text=index.to_toc())]
-            return [TextContent(type="text", text="Index not built. Run 'adt index' first.")]
-        
-        # Tool documentation
-        if category == "tools" and len(parts) >= 2 and parts[1] == "docs":
-            registry = load_all_tools(config)
-            return [TextContent(type="text", text=registry.to_prompt())]
+        handler = resource_handlers.get(category)
+        if handler is not None:
+            result = await handler(
+                first if has_first else None,
+                second if has_second else None,
+            )
+            if result is not None:
+                return result
         
         return [TextContent(type="text", text=f"Unknown resource: {uri}")]
     
     return server
 
 
+def _dir_mtime_ns(directory: Path) -> int:
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return 0
+
+
+_READ_CACHE_SIZE = 128
+
+
+def _read_markdown(file_path: Path) -> str | None:
+    """Read a knowledge file, or None if it doesn't exist.
+    
+    Runs on a worker thread so disk reads don't stall the event loop;
+    unchanged files are served from memory.
+    """
+    try:
+        stat = file_path.stat()
+    except OSError:
+        return None
+    return _read_markdown_cached(file_path, stat.st_mtime_ns, stat.st_size)
+
+
+def _prewarm_markdown(paths: list[Path]) -> None:
+    """Fill the read cache with up to its capacity of knowledge files."""
+    for path in paths[:_READ_CACHE_SIZE]:
+        try:
+            _read_markdown(path)
+        except (OSError, UnicodeDecodeError):
+            pass  # read_resource reports it if the file is actually requested
+
+
+@lru_cache(maxsize=_READ_CACHE_SIZE)
+def _read_markdown_cached(file_path: Path, mtime_ns: int, size: int) -> str:
+    return file_path.read_text(encoding="utf-8")
+
+
+# Python type name -> JSON schema type
+_JSON_TYPE_MAP = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+    "list": "array",
+    "dict": "object",
+    "List": "array",
+    "Dict": "object",
+    "None": "null",
+    "NoneType": "null",
+}
+
+
+def _input_schema(tool) -> dict:
+    """JSON schema for a tool's parameters."""
+    params = tool.params
+    return {
+        "type": "object",
+        "properties": {
+            p.name: {
+                "type": _python_type_to_json(p.type),
+                "description": p.description or f"Parameter {p.name}",
+            }
+            for p in params
+        },
+        "required": [p.name for p in params if p.required],
+    }
+
+
 def _python_type_to_json(python_type: str) -> str:
     """Convert Python type name to JSON schema type."""
-    mapping = {
-        "str": "string",
-        "int": "integer",
-        "float": "number",
-        "bool": "boolean",
-        "list": "array",
-        "dict": "object",
-        "List": "array",
-        "Dict": "object",
-        "None": "null",
-        "NoneType": "null",
-    }
-    return mapping.get(python_type, "string")
+    return _JSON_TYPE_MAP.get(python_type, "string")
 
 
 async def run_server():
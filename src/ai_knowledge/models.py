@@ -1,10 +1,11 @@
 """Core data models for the hierarchical knowledge index."""
 
+from collections.abc import Iterator
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class NodeType(str, Enum):
@@ -62,6 +63,18 @@ class Skill(BaseModel):
         return "\n".join(lines)
 
 
+_NODE_ICONS = {
+    NodeType.ROOT: "📚",
+    NodeType.CATEGORY: "📁",
+    NodeType.PROJECT: "🗂️",
+    NodeType.DOCUMENT: "📄",
+    NodeType.SECTION: "📑",
+    NodeType.ENTRY: "•",
+    NodeType.TOOL: "🔧",
+    NodeType.SKILL: "⚡",
+}
+
+
 class KnowledgeNode(BaseModel):
     """A node in the hierarchical knowledge tree."""
     
@@ -81,57 +94,108 @@ class KnowledgeNode(BaseModel):
     
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(default_factory=datetime.now)
+    
+    # Lookup caches built on first use; not serialized
+    _id_index: dict[str, "KnowledgeNode"] | None = PrivateAttr(default=None)
+    _type_index: dict[NodeType, list["KnowledgeNode"]] | None = PrivateAttr(default=None)
+    _search_key: tuple[str, str, frozenset[str]] | None = PrivateAttr(default=None)
+    _toc: str | None = PrivateAttr(default=None)
+    _compact_json: dict | None = PrivateAttr(default=None)
+    
+    def walk(self) -> Iterator["KnowledgeNode"]:
+        """Yield this node and all descendants depth-first, in document order."""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def clear_caches(self) -> None:
+        """Drop lookup caches; call after changing this node's subtree."""
+        self._id_index = None
+        self._type_index = None
+        self._toc = None
+        self._compact_json = None
+
+    def search_key(self) -> tuple[str, str, frozenset[str]]:
+        """Casefolded name and summary plus the tag set, computed once per node."""
+        if self._search_key is None:
+            self._search_key = (
+                self.name.casefold(),
+                (self.summary or "").casefold(),
+                frozenset(self.tags),
+            )
+        return self._search_key
+
+    def _id_map(self) -> dict[str, "KnowledgeNode"]:
+        if self._id_index is None:
+            id_index: dict[str, KnowledgeNode] = {}
+            for node in self.walk():
+                # First node in document order wins, as with the old recursive search
+                id_index.setdefault(node.id, node)
+            self._id_index = id_index
+        return self._id_index
 
     def find_by_id(self, node_id: str) -> "KnowledgeNode | None":
-        if self.id == node_id:
-            return self
-        for child in self.children:
-            result = child.find_by_id(node_id)
-            if result:
-                return result
-        return None
+        return self._id_map().get(node_id)
+
+    def find_many_by_ids(self, node_ids: set[str]) -> dict[str, "KnowledgeNode"]:
+        """Look up several ids at once; ids not in the tree are left out."""
+        id_map = self._id_map()
+        return {i: id_map[i] for i in node_ids if i in id_map}
 
     def find_by_tag(self, tag: str) -> list["KnowledgeNode"]:
-        results = []
-        if tag in self.tags:
-            results.append(self)
-        for child in self.children:
-            results.extend(child.find_by_tag(tag))
+        return [node for node in self.walk() if tag in node.tags]
+
+    def find_many_by_tags(self, tags: set[str]) -> dict[str, list["KnowledgeNode"]]:
+        """Nodes carrying each of several tags, gathered in a single walk."""
+        results: dict[str, list[KnowledgeNode]] = {tag: [] for tag in tags}
+        for node in self.walk():
+            if node.tags:
+                for tag in results.keys() & node.tags:
+                    results[tag].append(node)
         return results
 
     def find_by_type(self, node_type: NodeType) -> list["KnowledgeNode"]:
-        results = []
-        if self.node_type == node_type:
-            results.append(self)
-        for child in self.children:
-            results.extend(child.find_by_type(node_type))
-        return results
+        if self._type_index is None:
+            type_index: dict[NodeType, list[KnowledgeNode]] = {}
+            for node in self.walk():
+                type_index.setdefault(node.node_type, []).append(node)
+            self._type_index = type_index
+        return list(self._type_index.get(node_type, []))
 
     def to_toc(self, indent: int = 0) -> str:
-        """Generate a table-of-contents style representation for LLM consumption."""
-        prefix = "  " * indent
-        type_icon = {
-            NodeType.ROOT: "📚",
-            NodeType.CATEGORY: "📁",
-            NodeType.PROJECT: "🗂️",
-            NodeType.DOCUMENT: "📄",
-            NodeType.SECTION: "📑",
-            NodeType.ENTRY: "•",
-            NodeType.TOOL: "🔧",
-            NodeType.SKILL: "⚡",
-        }.get(self.node_type, "•")
+        """Generate a table-of-contents style representation for LLM consumption.
         
-        lines = [f"{prefix}{type_icon} [{self.id}] {self.name}"]
-        if self.summary:
-            lines.append(f"{prefix}   └─ {self.summary}")
+        The top-level render is memoized until clear_caches().
+        """
+        if indent == 0 and self._toc is not None:
+            return self._toc
         
-        for child in self.children:
-            lines.append(child.to_toc(indent + 1))
+        # One preorder walk into a single list of lines, joined once
+        lines: list[str] = []
+        stack = [(self, indent)]
+        while stack:
+            node, depth = stack.pop()
+            prefix = "  " * depth
+            lines.append(f"{prefix}{_NODE_ICONS.get(node.node_type, '•')} [{node.id}] {node.name}")
+            if node.summary:
+                lines.append(f"{prefix}   └─ {node.summary}")
+            stack.extend((child, depth + 1) for child in reversed(node.children))
         
-        return "\n".join(lines)
+        toc = "\n".join(lines)
+        if indent == 0:
+            self._toc = toc
+        return toc
 
     def to_compact_json(self) -> dict:
-        """Compact JSON for LLM context - omits empty fields."""
+        """Compact JSON for LLM context - omits empty fields.
+        
+        The result is memoized until clear_caches(); treat it as read-only.
+        """
+        if self._compact_json is not None:
+            return self._compact_json
+        
         data = {"id": self.id, "name": self.name, "type": self.node_type.value}
         if self.summary:
             data["summary"] = self.summary
@@ -141,6 +205,7 @@ class KnowledgeNode(BaseModel):
             data["tags"] = self.tags
         if self.children:
             data["children"] = [c.to_compact_json() for c in self.children]
+        self._compact_json = data
         return data
 
 
@@ -1,6 +1,5 @@
 """Agent lifecycle management."""
 
-import asyncio
 import json
 import subprocess
 import signal
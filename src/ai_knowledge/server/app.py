@@ -557,6 +557,8 @@ async def list_tasks(
     project: str | None = None,
     status: str | None = None,
     include_completed: bool = True,
+    limit: int = 100,
+    offset: int = 0,
 ):
     """List tasks in the queue."""
     from .db.models import TaskStatus as DBTaskStatus
@@ -568,11 +570,15 @@ async def list_tasks(
         except ValueError:
             pass
     
-    # Use SQLite repository
-    tasks = task_repo.list(status=status_filter, project=project, limit=100)
-    
-    # Filter out cancelled unless requested
-    tasks = [t for t in tasks if t.status != DBTaskStatus.CANCELLED]
+    # Use SQLite repository; cancelled tasks are left out in the query so
+    # they don't use up the page
+    tasks = task_repo.list(
+        status=status_filter,
+        project=project,
+        limit=limit,
+        offset=offset,
+        exclude=(DBTaskStatus.CANCELLED,),
+    )
     
     return [
         {
@@ -4,7 +4,6 @@ import os
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field
 
 
@@ -136,6 +135,8 @@ class Config(BaseModel):
         if not path.exists():
             return cls()
         
+        import yaml  # only needed once a config file exists
+        
         with open(path) as f:
             data = yaml.safe_load(f) or {}
         
@@ -149,6 +150,8 @@ class Config(BaseModel):
         if path is None:
             path = get_adt_home() / "config.yml"
         
+        import yaml
+        
         path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(path, "w") as f:
@@ -25,6 +25,13 @@ class DatabaseManager:
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA foreign_keys=ON")
+            # WAL only needs syncing at checkpoints; keep temp b-trees in RAM
+            # and read pages through a 256 MiB memory map.
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
+            conn.execute("PRAGMA mmap_size=268435456")
+            # Let a long-lived connection refresh stale planner statistics
+            conn.execute("PRAGMA optimize=0x10002")
             self._connections[db_name] = conn
         return self._connections[db_name]
     
@@ -39,9 +46,21 @@ class DatabaseManager:
             conn.rollback()
             raise
     
+    def maintain(self, db_name: str):
+        """Rebuild planner statistics and compact a database file."""
+        conn = self.get_connection(db_name)
+        conn.commit()
+        conn.execute("ANALYZE")
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    
     def close_all(self):
         """Close all database connections."""
         for conn in self._connections.values():
+            try:
+                conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
             conn.close()
         self._connections.clear()
 
@@ -63,6 +82,46 @@ def get_db(db_name: str) -> sqlite3.Connection:
     return get_db_manager().get_connection(db_name)
 
 
+_TASK_COUNTERS_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS task_counters (
+        project TEXT NOT NULL,
+        status TEXT NOT NULL,
+        n INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (project, status)
+    )
+    """,
+    """
+    INSERT INTO task_counters (project, status, n)
+    SELECT project, status, COUNT(*) FROM tasks GROUP BY project, status
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_counters_insert AFTER INSERT ON tasks
+    BEGIN
+        INSERT INTO task_counters (project, status, n) VALUES (NEW.project, NEW.status, 1)
+        ON CONFLICT (project, status) DO UPDATE SET n = n + 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_counters_delete AFTER DELETE ON tasks
+    BEGIN
+        UPDATE task_counters SET n = n - 1
+        WHERE project = OLD.project AND status = OLD.status;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_counters_update AFTER UPDATE OF project, status ON tasks
+    WHEN OLD.project IS NOT NEW.project OR OLD.status IS NOT NEW.status
+    BEGIN
+        UPDATE task_counters SET n = n - 1
+        WHERE project = OLD.project AND status = OLD.status;
+        INSERT INTO task_counters (project, status, n) VALUES (NEW.project, NEW.status, 1)
+        ON CONFLICT (project, status) DO UPDATE SET n = n + 1;
+    END
+    """,
+)
+
+
 def init_databases():
     """Initialize all database schemas."""
     manager = get_db_manager()
@@ -126,11 +185,29 @@ def init_databases():
             );
             
             CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
-            CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project);
+            CREATE INDEX IF NOT EXISTS idx_tasks_project_status ON tasks(project, status);
+            -- Superseded by idx_tasks_project_status, which also serves project-only lookups
+            DROP INDEX IF EXISTS idx_tasks_project;
             CREATE INDEX IF NOT EXISTS idx_tasks_priority_status ON tasks(priority, status);
             CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created_at);
         """)
         
+        # Per (project, status) task counts kept current by triggers, so
+        # stats don't have to scan the tasks table. The check is repeated
+        # under a write lock so two processes starting together don't both
+        # create and backfill the table.
+        has_counters = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_counters'"
+        if not conn.execute(has_counters).fetchone():
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if not conn.execute(has_counters).fetchone():
+                    for statement in _TASK_COUNTERS_SCHEMA:
+                        conn.execute(statement)
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+        
         # Migration: add new columns if they don't exist
         cursor = conn.execute("PRAGMA table_info(tasks)")
         columns = {row[1] for row in cursor.fetchall()}
@@ -154,14 +154,23 @@ class TaskRepository:
         status: Optional[TaskStatus] = None,
         project: Optional[str] = None,
         limit: int = 100,
+        offset: int = 0,
+        exclude: tuple[TaskStatus, ...] = (),
     ) -> list[Task]:
-        """List tasks with optional filters."""
+        """List tasks with optional filters, one page at a time.
+        
+        Filtering and paging happen in SQL, so only the requested page of
+        rows is read and converted.
+        """
         conditions = []
         params = []
         
         if status:
             conditions.append("status = ?")
             params.append(status.value)
+        if exclude:
+            conditions.append(f"status NOT IN ({', '.join('?' * len(exclude))})")
+            params.extend(s.value for s in exclude)
         if project:
             conditions.append("project = ?")
             params.append(project)
@@ -179,10 +188,10 @@ class TaskRepository:
                     ELSE 3 
                 END,
                 created_at
-            LIMIT ?
-        """, params + [limit])
+            LIMIT ? OFFSET ?
+        """, params + [limit, offset])
         
-        return [self._row_to_task(row) for row in cursor.fetchall()]
+        return [self._row_to_task(row) for row in cursor]
     
     def list_pending(self, limit: int = 10) -> list[Task]:
         """List pending tasks ordered by priority."""
@@ -337,11 +346,12 @@ class TaskRepository:
     
     def stats(self) -> dict:
         """Get task statistics."""
+        # Read the trigger-maintained counters instead of counting tasks
         cursor = self.db.execute("""
             SELECT 
                 status,
-                COUNT(*) as count
-            FROM tasks
+                SUM(n) as count
+            FROM task_counters
             GROUP BY status
         """)
         
@@ -2,6 +2,8 @@
 
 import json
 import uuid
+from collections import Counter
+from collections.abc import Iterable
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -69,16 +71,26 @@ class TaskQueue:
     
     def __init__(self):
         self._tasks: dict[str, Task] = {}
+        # (st_mtime_ns, st_size) of the file as last loaded or saved
+        self._stamp: tuple[int, int] | None = None
         self._load()
     
     def _get_path(self) -> Path:
         """Get the queue file path."""
         return get_adt_home() / "queue" / "tasks.json"
     
+    def _file_stamp(self) -> tuple[int, int] | None:
+        try:
+            stat = self._get_path().stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
     def _load(self) -> None:
         """Load tasks from file."""
         path = self._get_path()
-        if not path.exists():
+        self._stamp = self._file_stamp()
+        if self._stamp is None:
             return
         
         try:
@@ -89,6 +101,12 @@ class TaskQueue:
         except Exception:
             pass
     
+    def refresh(self) -> None:
+        """Reload tasks if another process changed the file since we last read or wrote it."""
+        if self._file_stamp() != self._stamp:
+            self._tasks = {}
+            self._load()
+    
     def _save(self) -> None:
         """Save tasks to file."""
         path = self._get_path()
@@ -96,6 +114,7 @@ class TaskQueue:
         
         data = [task.model_dump(mode="json") for task in self._tasks.values()]
         path.write_text(json.dumps(data, indent=2, default=str))
+        self._stamp = self._file_stamp()
     
     def add(self, task: Task) -> Task:
         """Add a task to the queue."""
@@ -119,6 +138,27 @@ class TaskQueue:
         )
         return self.add(task)
     
+    def create_many(self, specs: Iterable[dict]) -> list[Task]:
+        """Create tasks from dicts of Task fields, writing the file once.
+        
+        Keys other than project, description and priority go to metadata.
+        All specs are validated before any task is added.
+        """
+        tasks = []
+        for spec in specs:
+            fields = dict(spec)
+            tasks.append(Task(
+                project=fields.pop("project"),
+                description=fields.pop("description"),
+                priority=fields.pop("priority", TaskPriority.NORMAL),
+                metadata=fields,
+            ))
+        for task in tasks:
+            self._tasks[task.id] = task
+        if tasks:
+            self._save()
+        return tasks
+    
     def get(self, task_id: str) -> Task | None:
         """Get a task by ID."""
         return self._tasks.get(task_id)
@@ -128,8 +168,10 @@ class TaskQueue:
         project: str | None = None,
         status: TaskStatus | None = None,
         include_completed: bool = False,
+        limit: int | None = None,
+        offset: int = 0,
     ) -> list[Task]:
-        """List tasks with optional filters."""
+        """List tasks with optional filters; limit/offset select one page."""
         tasks = list(self._tasks.values())
         
         if project:
@@ -143,7 +185,9 @@ class TaskQueue:
         # Sort by priority (descending) then created_at (ascending)
         tasks.sort(key=lambda t: (t.priority, t.created_at), reverse=True)
         
-        return tasks
+        if limit is not None:
+            return tasks[offset:offset + limit]
+        return tasks[offset:] if offset else tasks
     
     def next(self, project: str | None = None) -> Task | None:
         """Get the next task to work on."""
@@ -246,16 +290,14 @@ class TaskQueue:
     
     def stats(self) -> dict:
         """Get queue statistics."""
-        tasks = list(self._tasks.values())
+        by_status = Counter(t.status for t in self._tasks.values())
+        by_project = Counter(t.project for t in self._tasks.values())
         return {
-            "total": len(tasks),
-            "pending": len([t for t in tasks if t.status == TaskStatus.PENDING]),
-            "in_progress": len([t for t in tasks if t.status == TaskStatus.IN_PROGRESS]),
-            "blocked": len([t for t in tasks if t.status == TaskStatus.BLOCKED]),
-            "completed": len([t for t in tasks if t.status == TaskStatus.COMPLETED]),
-            "failed": len([t for t in tasks if t.status == TaskStatus.FAILED]),
-            "by_project": {
-                project: len([t for t in tasks if t.project == project])
-                for project in set(t.project for t in tasks)
-            },
+            "total": len(self._tasks),
+            "pending": by_status[TaskStatus.PENDING],
+            "in_progress": by_status[TaskStatus.IN_PROGRESS],
+            "blocked": by_status[TaskStatus.BLOCKED],
+            "completed": by_status[TaskStatus.COMPLETED],
+            "failed": by_status[TaskStatus.FAILED],
+            "by_project": dict(by_project),
         }
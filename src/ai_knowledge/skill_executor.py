@@ -2,10 +2,11 @@
 
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .models import Skill
-from .skills import load_all_skills
+from .skills import SkillIndex, load_all_skills
 from .store import load_config
 from .tools import load_all_tools
 
@@ -49,13 +50,10 @@ def execute_skill(
         Dictionary with tool results and summary
     """
     config = load_config()
-    skills = load_all_skills(config)
+    skills = SkillIndex(load_all_skills(config))
     
     # Find the skill
-    skill = next(
-        (s for s in skills if s.name.lower() == skill_name.lower() or s.trigger == skill_name),
-        None
-    )
+    skill = skills.find(skill_name, skill_name)
     
     if not skill:
         return {"error": f"Skill not found: {skill_name}"}
@@ -82,18 +80,21 @@ def execute_skill(
         "errors": [],
     }
     
-    # Execute each tool
-    for tool_name in tool_names:
-        tool = registry.get(tool_name)
-        
-        if not tool:
-            results["errors"].append(f"Tool not found: {tool_name}")
-            continue
-        
-        if verbose:
-            print(f"Running: {tool_name}...")
-        
-        try:
+    # Tools don't depend on each other and mostly wait on the filesystem or
+    # subprocesses, so start them all on worker threads; results are still
+    # collected in reference order.
+    with ThreadPoolExecutor(max_workers=min(8, len(tool_names))) as pool:
+        pending = []
+        for tool_name in tool_names:
+            tool = registry.get(tool_name)
+            
+            if not tool:
+                pending.append((tool_name, None))
+                continue
+            
+            if verbose:
+                print(f"Running: {tool_name}...")
+            
             # Build kwargs based on tool params and provided args
             kwargs = {}
             
@@ -106,7 +107,15 @@ def execute_skill(
                 elif args and param.name in args:
                     kwargs[param.name] = args[param.name]
             
-            result = tool(**kwargs)
+            pending.append((tool_name, pool.submit(tool, **kwargs)))
+    
+    for tool_name, future in pending:
+        if future is None:
+            results["errors"].append(f"Tool not found: {tool_name}")
+            continue
+        
+        try:
+            result = future.result()
             results["tools_executed"].append(tool_name)
             results["tool_results"][tool_name] = result
             
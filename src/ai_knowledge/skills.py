@@ -1,8 +1,12 @@
 """Skill parsing and management."""
 
+import bisect
+import os
+import pickle
 import re
 from pathlib import Path
 
+from . import __version__
 from .models import GlobalConfig, KnowledgeNode, NodeType, ProjectConfig, Skill
 
 
@@ -134,20 +138,121 @@ def load_skills_from_dir(skills_dir: Path, scope: str = "global") -> list[Skill]
     return skills
 
 
+def _skill_dirs(config: GlobalConfig) -> list[tuple[Path, str]]:
+    """Get (skills_dir, scope) pairs for global and project skills."""
+    dirs = [(config.global_skills_path, "global")]
+    for project in config.projects:
+        dirs.append((project.skills_path, project.name))
+    return dirs
+
+
+def _skills_fingerprint(skill_dirs: list[tuple[Path, str]]) -> tuple:
+    """Summarize the skill files, their mtimes and sizes so changes can be detected."""
+    from .store import SKILLS_CACHE_VERSION
+    
+    entries = []
+    for skills_dir, scope in skill_dirs:
+        try:
+            with os.scandir(skills_dir) as it:
+                # DirEntry caches its stat() result, so this is one stat per file
+                files = tuple(sorted(
+                    (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                    for entry in it
+                    if entry.name.endswith(".md")
+                ))
+        except OSError:
+            files = ()
+        entries.append((str(skills_dir), scope, files))
+    return (SKILLS_CACHE_VERSION, __version__, tuple(entries))
+
+
+# Last skill list returned by load_all_skills, keyed by _skills_fingerprint
+_skills_cache: tuple[tuple, list[Skill]] | None = None
+
+
 def load_all_skills(config: GlobalConfig) -> list[Skill]:
-    """Load all skills from global and project directories."""
-    skills = []
+    """Load all skills from global and project directories.
     
-    # Global skills
-    skills.extend(load_skills_from_dir(config.global_skills_path, "global"))
+    Parsed skills are pickled to the config dir and reused by later
+    invocations until a skill file is added, removed or modified; within
+    a process the unpickled list is reused as well.
+    """
+    global _skills_cache
+    from .store import DEFAULT_CONFIG_DIR, SKILLS_CACHE_FILE, write_atomic
     
-    # Project skills
-    for project in config.projects:
-        skills.extend(load_skills_from_dir(project.skills_path, project.name))
+    skill_dirs = _skill_dirs(config)
+    fingerprint = _skills_fingerprint(skill_dirs)
+    if _skills_cache is not None and _skills_cache[0] == fingerprint:
+        return _skills_cache[1]
+    
+    cache_path = DEFAULT_CONFIG_DIR / SKILLS_CACHE_FILE
+    try:
+        cached_fingerprint, cached_skills = pickle.loads(cache_path.read_bytes())
+        if cached_fingerprint == fingerprint:
+            _skills_cache = (fingerprint, cached_skills)
+            return cached_skills
+    except Exception:
+        pass  # missing, stale format or unreadable; parse the files
     
+    skills = []
+    for skills_dir, scope in skill_dirs:
+        skills.extend(load_skills_from_dir(skills_dir, scope))
+    
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(cache_path, pickle.dumps((fingerprint, skills), protocol=5))
+    except OSError:
+        pass  # caching is best-effort
+    
+    _skills_cache = (fingerprint, skills)
     return skills
 
 
+class SkillIndex:
+    """Skills keyed by id, lowercased name and trigger, for O(1) lookup.
+    
+    Lookups resolve to the earliest matching skill in load order, the same
+    skill a linear scan over load_all_skills() would return.
+    """
+    
+    def __init__(self, skills: list[Skill]):
+        self.skills = skills
+        self._by_id: dict[str, int] = {}
+        self._by_name: dict[str, int] = {}
+        self._by_trigger: dict[str, int] = {}
+        self._sorted_names: list[str] | None = None
+        for i, s in enumerate(skills):
+            self._by_id.setdefault(s.id, i)
+            self._by_name.setdefault(s.name.lower(), i)
+            if s.trigger:
+                self._by_trigger.setdefault(s.trigger, i)
+    
+    def get(self, skill_id: str) -> Skill | None:
+        """Find a skill by its exact id."""
+        i = self._by_id.get(skill_id)
+        return self.skills[i] if i is not None else None
+    
+    def find(self, name: str, *triggers: str) -> Skill | None:
+        """Find a skill by case-insensitive name or by any of the exact triggers."""
+        hits = [self._by_trigger.get(t) for t in triggers]
+        hits.append(self._by_name.get(name.lower()))
+        positions = [i for i in hits if i is not None]
+        return self.skills[min(positions)] if positions else None
+    
+    def find_prefix(self, prefix: str) -> list[Skill]:
+        """Skills whose lowercased name starts with prefix (case-insensitive), sorted by name."""
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._by_name)
+        names = self._sorted_names
+        prefix = prefix.lower()
+        matches = []
+        for i in range(bisect.bisect_left(names, prefix), len(names)):
+            if not names[i].startswith(prefix):
+                break
+            matches.append(self.skills[self._by_name[names[i]]])
+        return matches
+
+
 def build_skills_node(skills: list[Skill], category_name: str, category_id: str) -> KnowledgeNode:
     """Build a knowledge node for a collection of skills."""
     children = []
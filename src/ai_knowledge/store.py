@@ -1,14 +1,38 @@
 """Persistent storage for configuration and index."""
 
+import hashlib
 import json
+import mmap
+import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .models import GlobalConfig, KnowledgeNode, ProjectConfig
+from . import __version__
+from .jsonutil import dumps
+from .models import GlobalConfig, KnowledgeNode, ProjectConfig, Skill
+
+if TYPE_CHECKING:
+    from .tools.base import Tool
 
 
 DEFAULT_CONFIG_DIR = Path.home() / ".config" / "agent-dev-tool"
 CONFIG_FILE = "config.json"
 INDEX_FILE = "index.json"
+INDEX_CACHE_FILE = "index.pickle"
+# Bump when KnowledgeNode changes shape so old pickles are ignored
+INDEX_CACHE_VERSION = 2
+TOC_FILE = "index.toc.txt"
+COMPACT_FILE = "index.compact.json"
+PROMPT_CACHE_DIR = "prompt_cache"
+PROMPT_CACHE_MAX = 256  # files kept in PROMPT_CACHE_DIR
+SKILLS_CACHE_FILE = "skills.pickle"
+# Bump when skill parsing or the Skill model changes
+SKILLS_CACHE_VERSION = 1
+SECTIONS_CACHE_FILE = "sections.pickle"
+# Bump when section parsing or summarize_section changes
+SECTIONS_CACHE_VERSION = 2
 
 
 def ensure_config_dir() -> Path:
@@ -16,12 +40,38 @@ def ensure_config_dir() -> Path:
     return DEFAULT_CONFIG_DIR
 
 
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace path with data so readers see either the old or the new file.
+    
+    An interrupted save can't leave a truncated config or index behind, and
+    a reader that has the old index.pickle mapped keeps its pages.
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def load_config() -> GlobalConfig:
     config_path = DEFAULT_CONFIG_DIR / CONFIG_FILE
-    if config_path.exists():
-        data = json.loads(config_path.read_text())
-        return GlobalConfig(**data)
-    return GlobalConfig()
+    try:
+        st = config_path.stat()
+    except OSError:
+        return GlobalConfig()
+    # Hand out a copy so unsaved edits can't leak into later loads in
+    # long-lived processes (the daemon, the MCP server).
+    return _read_config(config_path, st.st_mtime_ns, st.st_size).model_copy(deep=True)
+
+
+# Keyed by path and stat so repeat loads within one process parse the file
+# once, while edits made by other processes are still picked up.
+@lru_cache(maxsize=1)
+def _read_config(config_path: Path, mtime_ns: int, size: int) -> GlobalConfig:
+    data = json.loads(config_path.read_text())
+    return GlobalConfig(**data)
 
 
 def save_config(config: GlobalConfig) -> None:
@@ -29,24 +79,144 @@ def save_config(config: GlobalConfig) -> None:
     config_path = DEFAULT_CONFIG_DIR / CONFIG_FILE
     
     # Convert to JSON-serializable dict
-    data = json.loads(config.model_dump_json())
-    config_path.write_text(json.dumps(data, indent=2))
+    data = config.model_dump(mode="json")
+    text = json.dumps(data, indent=2)
+    
+    # Commands like `adt init` save unconditionally; leave an identical
+    # file (and its mtime) alone instead of rewriting it.
+    try:
+        if config_path.read_text() == text:
+            return
+    except OSError:
+        pass
+    
+    write_atomic(config_path, text.encode("utf-8"))
+    _read_config.cache_clear()
 
 
 def load_index() -> KnowledgeNode | None:
     index_path = DEFAULT_CONFIG_DIR / INDEX_FILE
-    if index_path.exists():
-        data = json.loads(index_path.read_text())
-        return KnowledgeNode(**data)
-    return None
+    try:
+        st = index_path.stat()
+    except OSError:
+        return None
+    # The cache holds the pickled tree rather than the tree itself, so every
+    # caller gets its own copy to edit.
+    return pickle.loads(_read_index(index_path, st.st_mtime_ns, st.st_size))
+
+
+@lru_cache(maxsize=1)
+def _read_index(index_path: Path, mtime_ns: int, size: int) -> memoryview | bytes:
+    """The index pickled, mapped from the binary copy if it is current."""
+    # The binary copy skips JSON parsing and model validation; index.json
+    # stays the source of truth for older or hand-edited indexes. Its header
+    # is pickled on its own so it can be checked without loading the tree.
+    if _is_fresh(INDEX_CACHE_FILE):
+        try:
+            with (DEFAULT_CONFIG_DIR / INDEX_CACHE_FILE).open("rb") as f:
+                if pickle.load(f) == (INDEX_CACHE_VERSION, __version__):
+                    # Unpickle straight from the page cache instead of copying
+                    # the file; the mapping outlives save_index replacing it.
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    return memoryview(mm)[f.tell():]
+        except Exception:
+            pass  # unreadable or from an incompatible version; use the JSON
+    
+    data = json.loads(index_path.read_text())
+    return pickle.dumps(KnowledgeNode(**data), protocol=5)
 
 
 def save_index(index: KnowledgeNode) -> None:
     ensure_config_dir()
     index_path = DEFAULT_CONFIG_DIR / INDEX_FILE
     
-    data = json.loads(index.model_dump_json())
-    index_path.write_text(json.dumps(data, indent=2))
+    data = index.model_dump(mode="json")
+    write_atomic(index_path, json.dumps(data, indent=2).encode("utf-8"))
+    header = pickle.dumps((INDEX_CACHE_VERSION, __version__), protocol=5)
+    write_atomic(DEFAULT_CONFIG_DIR / INDEX_CACHE_FILE, header + pickle.dumps(index, protocol=5))
+    _read_index.cache_clear()
+    
+    # Pre-render the read-only views so toc/tree/context don't rebuild them
+    write_atomic(DEFAULT_CONFIG_DIR / TOC_FILE, index.to_toc().encode("utf-8"))
+    write_atomic(DEFAULT_CONFIG_DIR / COMPACT_FILE, dumps(index.to_compact_json()).encode("utf-8"))
+
+
+def _is_fresh(file_name: str) -> bool:
+    """Whether a file derived by save_index is at least as new as the index."""
+    index_path = DEFAULT_CONFIG_DIR / INDEX_FILE
+    try:
+        return (DEFAULT_CONFIG_DIR / file_name).stat().st_mtime >= index_path.stat().st_mtime
+    except OSError:
+        return False
+
+
+def _load_rendered(file_name: str) -> str | None:
+    """Read a view rendered by save_index, if it is at least as new as the index."""
+    if _is_fresh(file_name):
+        try:
+            return (DEFAULT_CONFIG_DIR / file_name).read_text(encoding="utf-8")
+        except OSError:
+            pass
+    return None
+
+
+def load_toc() -> str | None:
+    """Load the index table of contents, rendering it if no cached copy exists."""
+    toc = _load_rendered(TOC_FILE)
+    if toc is None:
+        index = load_index()
+        toc = index.to_toc() if index else None
+    return toc
+
+
+def load_compact_json() -> str | None:
+    """Load the compact JSON view of the index as indented text."""
+    text = _load_rendered(COMPACT_FILE)
+    if text is None:
+        index = load_index()
+        text = dumps(index.to_compact_json()) if index else None
+    return text
+
+
+def load_prompt(item: "Skill | Tool") -> str:
+    """Return item.to_prompt(), reusing the copy cached on disk while its file is unchanged."""
+    if item.file_path is None:
+        return item.to_prompt()
+    
+    key = hashlib.sha1(f"{__version__}:{item.file_path}:{item.name}".encode()).hexdigest()
+    cache_path = DEFAULT_CONFIG_DIR / PROMPT_CACHE_DIR / f"{key}.md"
+    try:
+        if cache_path.stat().st_mtime_ns >= Path(item.file_path).stat().st_mtime_ns:
+            return cache_path.read_text()
+    except OSError:
+        pass
+    
+    text = item.to_prompt()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(cache_path, text.encode())
+        _prune_prompt_cache(cache_path.parent)
+    except OSError:
+        pass  # caching is best-effort
+    return text
+
+
+def _prune_prompt_cache(cache_dir: Path) -> None:
+    """Drop the least recently written prompts beyond PROMPT_CACHE_MAX.
+    
+    Entries for removed skills, renamed files and old versions are never
+    read again, so this is what keeps the directory from growing.
+    """
+    with os.scandir(cache_dir) as it:
+        entries = [e for e in it if e.name.endswith(".md")]
+    if len(entries) <= PROMPT_CACHE_MAX:
+        return
+    entries.sort(key=lambda e: e.stat().st_mtime_ns)
+    for entry in entries[:-PROMPT_CACHE_MAX]:
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
 
 
 def get_index_path() -> Path:
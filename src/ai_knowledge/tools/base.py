@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import inspect
 import json
 from dataclasses import dataclass, field
@@ -100,13 +101,27 @@ class ToolRegistry:
     
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._sorted_names: list[str] | None = None
     
     def register(self, t: Tool) -> None:
         self._tools[t.name] = t
+        self._sorted_names = None
     
     def get(self, name: str) -> Tool | None:
         return self._tools.get(name)
     
+    def find_prefix(self, prefix: str) -> list[str]:
+        """Names of tools starting with prefix, in sorted order."""
+        if self._sorted_names is None:
+            self._sorted_names = sorted(self._tools)
+        names = self._sorted_names
+        matches = []
+        for i in range(bisect.bisect_left(names, prefix), len(names)):
+            if not names[i].startswith(prefix):
+                break
+            matches.append(names[i])
+        return matches
+    
     def list(self, scope: str | None = None, tag: str | None = None) -> list[Tool]:
         tools = list(self._tools.values())
         if scope:
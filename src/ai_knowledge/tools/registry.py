@@ -1,6 +1,7 @@
 """Tool discovery and loading from .ai/tools directories."""
 
 import importlib.util
+import os
 import sys
 from pathlib import Path
 
@@ -65,29 +66,63 @@ def load_tools_from_dir(tools_dir: Path, scope: str = "global") -> list[Tool]:
     return tools
 
 
+def _tool_dirs(config: GlobalConfig) -> list[tuple[Path, str]]:
+    """Get (tools_dir, scope) pairs for global and project tools."""
+    dirs = [(config.global_ai_dir / "tools", "global")]
+    for project in config.projects:
+        dirs.append((project.full_ai_path / "tools", project.name))
+    return dirs
+
+
+def _tools_fingerprint(tool_dirs: list[tuple[Path, str]]) -> tuple:
+    """Summarize the tool files and their mtimes so changes can be detected."""
+    entries = []
+    for tools_dir, scope in tool_dirs:
+        try:
+            with os.scandir(tools_dir) as it:
+                files = tuple(sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in it
+                    if entry.name.endswith(".py")
+                ))
+        except OSError:
+            files = ()
+        entries.append((str(tools_dir), scope, files))
+    return tuple(entries)
+
+
 def discover_tools(config: GlobalConfig) -> list[Tool]:
     """Discover all tools from global and project directories."""
     all_tools = []
     
-    # Global tools
-    global_tools_dir = config.global_ai_dir / "tools"
-    all_tools.extend(load_tools_from_dir(global_tools_dir, "global"))
-    
-    # Project tools
-    for project in config.projects:
-        project_tools_dir = project.full_ai_path / "tools"
-        all_tools.extend(load_tools_from_dir(project_tools_dir, project.name))
+    for tools_dir, scope in _tool_dirs(config):
+        all_tools.extend(load_tools_from_dir(tools_dir, scope))
     
     return all_tools
 
 
+# Last registry built by load_all_tools, keyed by _tools_fingerprint
+_registry_cache: tuple[tuple, ToolRegistry] | None = None
+
+
 def load_all_tools(config: GlobalConfig) -> ToolRegistry:
-    """Load all tools into a new registry."""
+    """Load all tools into a registry.
+    
+    The registry is reused within the process until a tool file is added,
+    removed or modified, so repeated calls skip re-importing every tool.
+    """
+    global _registry_cache
+    
+    fingerprint = _tools_fingerprint(_tool_dirs(config))
+    if _registry_cache is not None and _registry_cache[0] == fingerprint:
+        return _registry_cache[1]
+    
     registry = ToolRegistry()
     
     for tool in discover_tools(config):
         registry.register(tool)
     
+    _registry_cache = (fingerprint, registry)
     return registry
 
 